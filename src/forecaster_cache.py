@@ -0,0 +1,125 @@
+"""
+MediLink PHC - Forecaster Model Cache
+Training-data selection and the pickled Prophet model shared by the prediction services
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+from typing import Tuple
+
+import pandas as pd
+
+try:
+    import cloudpickle
+    CLOUDPICKLE_AVAILABLE = True
+except ImportError:
+    CLOUDPICKLE_AVAILABLE = False
+
+try:
+    import prophet
+    PROPHET_VERSION = prophet.__version__
+except ImportError:
+    PROPHET_VERSION = None
+
+MODEL_CACHE_PATH = os.path.join("models", "forecaster.pkl")
+
+def training_source(data_path: str) -> str:
+    """
+    File the forecaster is trained from
+    
+    The Parquet copy of the CSV is preferred (faster to read), but only
+    while it is at least as new as the CSV; a stale copy is ignored.
+    """
+    parquet_path = os.path.splitext(data_path)[0] + ".parquet"
+    try:
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(data_path):
+            return parquet_path
+    except OSError:
+        pass  # no Parquet copy
+    return data_path
+
+def file_hash(path: str) -> str:
+    """Content hash of a training file, used to invalidate cached models"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def model_cache_key(forecaster, data_hash: str, test_split: float) -> Tuple:
+    """Everything a fitted model depends on: data, split, settings and Prophet"""
+    return (data_hash, float(test_split), forecaster.MODEL_VERSION, PROPHET_VERSION)
+
+def load_cached_model(forecaster, cache_key: Tuple) -> bool:
+    """Load the pickled Prophet model if it was fitted under the same key"""
+    if not os.path.exists(MODEL_CACHE_PATH):
+        return False
+    try:
+        with open(MODEL_CACHE_PATH, 'rb') as f:
+            cached_key, model = pickle.load(f)
+    except Exception as e:
+        print(f"Warning: Could not read cached model: {e}")
+        return False
+    if cached_key != cache_key:
+        return False
+    forecaster.model = model
+    forecaster.trained = True
+    return True
+
+def store_cached_model(forecaster, cache_key: Tuple) -> None:
+    """
+    Pickle the fitted model together with its cache key
+    
+    Written to a temporary file and moved into place, so a service reading
+    the cache never sees a half-written pickle from another one.
+    """
+    dump = cloudpickle.dump if CLOUDPICKLE_AVAILABLE else pickle.dump
+    cache_dir = os.path.dirname(MODEL_CACHE_PATH)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                dump((cache_key, forecaster.model), f)
+            os.replace(tmp_path, MODEL_CACHE_PATH)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except Exception as e:
+        print(f"Warning: Could not cache trained model: {e}")
+
+def load_or_train(forecaster, data_path: str, test_split: float = 0.2) -> Tuple[str, bool]:
+    """
+    Fit forecaster on data_path, reusing the cached model when possible
+    
+    The cache is keyed on the hash of the file actually read (see
+    training_source) plus the training settings (model_cache_key), so a
+    model is never reused for different data or a different fit.
+    
+    Returns:
+        Tuple of (model key digest, whether the model came from the cache);
+        the digest changes whenever the model would be retrained
+    """
+    source_path = training_source(data_path)
+    cache_key = model_cache_key(forecaster, file_hash(source_path), test_split)
+    if load_cached_model(forecaster, cache_key):
+        return _key_digest(cache_key), True
+    
+    if source_path == data_path:
+        df = forecaster.load_data(data_path)
+    else:
+        try:
+            df = pd.read_parquet(source_path, columns=['ds', 'y'])
+        except Exception as e:
+            print(f"Warning: Could not read {source_path}, falling back to CSV: {e}")
+            cache_key = model_cache_key(forecaster, file_hash(data_path), test_split)
+            if load_cached_model(forecaster, cache_key):
+                return _key_digest(cache_key), True
+            df = forecaster.load_data(data_path)
+    
+    forecaster.train_model(df, test_split=test_split)
+    store_cached_model(forecaster, cache_key)
+    return _key_digest(cache_key), False
+
+def _key_digest(cache_key: Tuple) -> str:
+    """Short stable name for a cache key, for file names"""
+    return hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
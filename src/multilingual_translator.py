@@ -4,486 +4,527 @@ Supports Nigerian languages: Pidgin, Hausa, Igbo, Yoruba
 """
 
 import re
+import unicodedata
+from bisect import bisect_right
+from functools import cache, lru_cache
+from itertools import accumulate
 from typing import List, Dict, Tuple, Optional
 
+from phrase_matching import LazyMatchers, build_mapping, fold
+
+# Triage inputs repeat heavily ("zazzabi", "body dey hot"), so detection and
+# translation results are memoized per translator instance
+DETECT_CACHE_SIZE = 4096
+TRANSLATE_CACHE_SIZE = 1024
+
+_WORD_RE = re.compile(r'\w+')
+
+# Joins symptoms for batch translation; no mapping phrase contains it
+_BATCH_SEPARATOR = '\x00'
+
+# Matcher key for the merged table of every language's phrases
+_ALL_LANGUAGES = '*'
+
 class MultilingualTranslator:
     """Translates Nigerian languages to English for medical triage"""
     
     def __init__(self):
-        self.languages = {
-            'pidgin': self._get_pidgin_mappings(),
-            'hausa': self._get_hausa_mappings(),
-            'igbo': self._get_igbo_mappings(),
-            'yoruba': self._get_yoruba_mappings()
+        # Mapping tables are built once per process and shared by every
+        # instance (they are never mutated); a language's regex/automaton is
+        # only compiled the first time a symptom in that language is seen
+        (self.languages, self.language_keywords, self._keyword_languages,
+         self._matchers) = self._build_tables()
+        self._language_ids = tuple(self.language_keywords)
+        
+        # The translator is read-only after construction, so results can be
+        # cached on the instance
+        self.detect_language = lru_cache(maxsize=DETECT_CACHE_SIZE)(self.detect_language)
+        self._translate_symptoms_cached = lru_cache(maxsize=TRANSLATE_CACHE_SIZE)(
+            self._translate_symptom_tuple
+        )
+    
+    @classmethod
+    @cache
+    def _build_tables(cls):
+        """Build the mapping and matching tables shared by all instances"""
+        languages = {
+            'pidgin': cls._get_pidgin_mappings(),
+            'hausa': cls._get_hausa_mappings(),
+            'igbo': cls._get_igbo_mappings(),
+            'yoruba': cls._get_yoruba_mappings()
+        }
+        
+        # Language detection keywords (NFC, casefolded); each is a whole word,
+        # so detection is a set lookup per token rather than a regex per keyword
+        language_keywords = {
+            'pidgin': frozenset({'dey', 'don', 'fit', 'comot', 'belle'}),
+            'hausa': frozenset({'zazzabi', 'ciwon', 'gudawa', 'amai', 'tari'}),
+            'igbo': frozenset({'oku', 'isi', 'afo', 'mgbawa', 'ukwu'}),
+            'yoruba': frozenset({'ibà', 'ori', 'ikun', 'ìtọ', 'ikọ'})
         }
         
-        # Language detection patterns
-        self.language_patterns = {
-            'pidgin': [r'\bdey\b', r'\bdon\b', r'\bfit\b', r'\bcomot\b', r'\bbelle\b'],
-            'hausa': [r'\bzazzabi\b', r'\bciwon\b', r'\bgudawa\b', r'\bamai\b', r'\btari\b'],
-            'igbo': [r'\boku\b', r'\bisi\b', r'\bafo\b', r'\bmgbawa\b', r'\bukwu\b'],
-            'yoruba': [r'\bibà\b', r'\bori\b', r'\bikun\b', r'\bìtọ\b', r'\bikọ\b']
+        # Inverted index: keyword -> language id (position in
+        # language_keywords), so each token is looked up once and tallied
+        # into a fixed-size score list
+        keyword_languages = {
+            keyword: lang_id
+            for lang_id, keywords in enumerate(language_keywords.values())
+            for keyword in keywords
         }
+        
+        # Every language's phrases in one table for translate_any; a phrase
+        # shared by two languages keeps the earlier language's translation
+        all_mappings = {}
+        for mappings in languages.values():
+            for phrase, english in mappings.items():
+                all_mappings.setdefault(phrase, english)
+        
+        matchers = LazyMatchers({**languages, _ALL_LANGUAGES: all_mappings})
+        return languages, language_keywords, keyword_languages, matchers
     
-    def _get_pidgin_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_pidgin_mappings() -> Dict[str, str]:
         """Pidgin English medical translations"""
-        return {
+        return build_mapping('pidgin', [
             # Fever & Temperature
-            "body dey hot": "fever",
-            "body dey burn": "high fever",
-            "temperature high": "fever",
-            "e dey hot": "fever",
-            "im body hot": "fever",
-            "hot body": "fever",
+            ("body dey hot", "fever"),
+            ("body dey burn", "high fever"),
+            ("temperature high", "fever"),
+            ("e dey hot", "fever"),
+            ("im body hot", "fever"),
+            ("hot body", "fever"),
             
             # Pain symptoms
-            "head dey pain me": "headache",
-            "head dey hammer me": "severe headache",
-            "my head dey burst": "severe headache",
-            "belle dey pain": "stomach pain",
-            "belle dey pain me": "abdominal pain",
-            "stomach dey do me": "stomach pain",
-            "body dey pain": "body aches",
-            "body dey ache": "body pain",
-            "chest dey pain": "chest pain",
-            "back dey pain": "back pain",
-            "throat dey pain": "sore throat",
-            "joint dey pain": "joint pain",
+            ("head dey pain me", "headache"),
+            ("head dey hammer me", "severe headache"),
+            ("my head dey burst", "severe headache"),
+            ("belle dey pain", "stomach pain"),
+            ("belle dey pain me", "abdominal pain"),
+            ("stomach dey do me", "stomach pain"),
+            ("body dey pain", "body aches"),
+            ("body dey ache", "body pain"),
+            ("chest dey pain", "chest pain"),
+            ("back dey pain", "back pain"),
+            ("throat dey pain", "sore throat"),
+            ("joint dey pain", "joint pain"),
             
             # Diarrhea & Vomiting
-            "shit dey run": "diarrhea",
-            "belle dey run": "diarrhea",
-            "shit dey comot": "diarrhea",
-            "running belle": "diarrhea",
-            "purge": "diarrhea",
-            "e dey purge": "diarrhea",
-            "e dey vomit": "vomiting",
-            "im dey throw up": "vomiting",
-            "e wan comot": "nausea",
-            "belle wan comot": "nausea",
+            ("shit dey run", "diarrhea"),
+            ("belle dey run", "diarrhea"),
+            ("shit dey comot", "diarrhea"),
+            ("running belle", "diarrhea"),
+            ("purge", "diarrhea"),
+            ("e dey purge", "diarrhea"),
+            ("e dey vomit", "vomiting"),
+            ("im dey throw up", "vomiting"),
+            ("e wan comot", "nausea"),
+            ("belle wan comot", "nausea"),
             
             # Weakness & Fatigue
-            "body no get power": "weakness",
-            "body weak": "fatigue",
-            "no strength": "weakness",
-            "e no fit stand": "severe weakness",
-            "im body don weak": "fatigue",
-            "no energy": "fatigue",
-            "body don tire": "exhaustion",
+            ("body no get power", "weakness"),
+            ("body weak", "fatigue"),
+            ("no strength", "weakness"),
+            ("e no fit stand", "severe weakness"),
+            ("im body don weak", "fatigue"),
+            ("no energy", "fatigue"),
+            ("body don tire", "exhaustion"),
             
             # Breathing problems
-            "i no fit breathe well": "difficulty breathing",
-            "breath dey hard": "shortness of breath",
-            "chest dey tight": "chest tightness",
-            "e no fit breath": "respiratory distress",
-            "breath dey fast": "fast breathing",
+            ("i no fit breathe well", "difficulty breathing"),
+            ("breath dey hard", "shortness of breath"),
+            ("chest dey tight", "chest tightness"),
+            ("e no fit breath", "respiratory distress"),
+            ("breath dey fast", "fast breathing"),
             
             # Cough
-            "cough dey worry me": "persistent cough",
-            "e dey cough": "coughing",
-            "im dey cough blood": "coughing blood",
-            "dry cough": "dry cough",
+            ("cough dey worry me", "persistent cough"),
+            ("e dey cough", "coughing"),
+            ("im dey cough blood", "coughing blood"),
+            ("dry cough", "dry cough"),
             
             # Loss of consciousness & Seizures
-            "e don faint": "unconscious",
-            "e loss consciousness": "unconscious",
-            "im body dey shake": "convulsions",
-            "e dey shake": "seizures",
-            "fit dey catch am": "seizures",
+            ("e don faint", "unconscious"),
+            ("e loss consciousness", "unconscious"),
+            ("im body dey shake", "convulsions"),
+            ("e dey shake", "seizures"),
+            ("fit dey catch am", "seizures"),
             
             # Dehydration
-            "eye don sink": "sunken eyes",
-            "mouth dry": "dry mouth",
-            "no urine": "reduced urination",
-            "body don dry": "dehydration",
+            ("eye don sink", "sunken eyes"),
+            ("mouth dry", "dry mouth"),
+            ("no urine", "reduced urination"),
+            ("body don dry", "dehydration"),
             
             # Bleeding
-            "blood dey comot": "bleeding",
-            "blood dey run": "bleeding",
-            "im dey shit blood": "bloody stool",
-            "blood dey come from nose": "nosebleed",
+            ("blood dey comot", "bleeding"),
+            ("blood dey run", "bleeding"),
+            ("im dey shit blood", "bloody stool"),
+            ("blood dey come from nose", "nosebleed"),
             
             # Skin conditions
-            "body dey scratch": "itching",
-            "rash dey": "rash",
-            "skin dey peel": "skin peeling",
-            "boil": "skin abscess",
+            ("body dey scratch", "itching"),
+            ("rash dey", "rash"),
+            ("skin dey peel", "skin peeling"),
+            ("boil", "skin abscess"),
             
             # Pregnancy related
-            "belle": "pregnant",
-            "im get belle": "pregnant",
-            "pregnancy": "pregnant",
+            ("belle", "pregnant"),
+            ("im get belle", "pregnant"),
+            ("pregnancy", "pregnant"),
             
             # General descriptions
-            "very bad": "severe",
-            "small small": "mild",
-            "plenty": "many",
-            "no be small": "serious",
-            "e serious": "severe",
-            "e don worse": "worsening",
-            "since": "for",
-            "done reach": "about",
+            ("very bad", "severe"),
+            ("small small", "mild"),
+            ("plenty", "many"),
+            ("no be small", "serious"),
+            ("e serious", "severe"),
+            ("e don worse", "worsening"),
+            ("since", "for"),
+            ("done reach", "about"),
             
             # Time descriptions
-            "yesterday": "1 day",
-            "today": "less than 1 day",
-            "last week": "7 days",
-            "some days": "few days",
-            "long time": "many days",
-            "just now": "recently"
-        }
+            ("yesterday", "1 day"),
+            ("today", "less than 1 day"),
+            ("last week", "7 days"),
+            ("some days", "few days"),
+            ("long time", "many days"),
+            ("just now", "recently")
+        ])
     
-    def _get_hausa_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_hausa_mappings() -> Dict[str, str]:
         """Hausa medical translations"""
-        return {
+        return build_mapping('hausa', [
             # Fever & Temperature
-            "zazzabi": "fever",
-            "zazzabi mai tsanani": "high fever",
-            "jiki yana zafi": "fever",
-            "zafi mai tsanani": "high fever",
-            "jiki yana da zafi": "fever",
+            ("zazzabi", "fever"),
+            ("zazzabi mai tsanani", "high fever"),
+            ("jiki yana zafi", "fever"),
+            ("zafi mai tsanani", "high fever"),
+            ("jiki yana da zafi", "fever"),
             
             # Pain symptoms
-            "ciwon kai": "headache",
-            "ciwon kai mai tsanani": "severe headache",
-            "kai yana ciwo": "headache",
-            "ciwon ciki": "stomach pain",
-            "ciwon ciki mai tsanani": "severe abdominal pain",
-            "ciki yana ciwo": "stomach pain",
-            "ciwon jiki": "body aches",
-            "jiki yana ciwo": "body pain",
-            "ciwon kirji": "chest pain",
-            "kirji yana ciwo": "chest pain",
-            "ciwon baya": "back pain",
-            "baya yana ciwo": "back pain",
-            "ciwon makogwaro": "sore throat",
-            "makogwaro yana ciwo": "sore throat",
-            "ciwon gwiwa": "joint pain",
-            "gwiwa yana ciwo": "joint pain",
+            ("ciwon kai", "headache"),
+            ("ciwon kai mai tsanani", "severe headache"),
+            ("kai yana ciwo", "headache"),
+            ("ciwon ciki", "stomach pain"),
+            ("ciwon ciki mai tsanani", "severe abdominal pain"),
+            ("ciki yana ciwo", "stomach pain"),
+            ("ciwon jiki", "body aches"),
+            ("jiki yana ciwo", "body pain"),
+            ("ciwon kirji", "chest pain"),
+            ("kirji yana ciwo", "chest pain"),
+            ("ciwon baya", "back pain"),
+            ("baya yana ciwo", "back pain"),
+            ("ciwon makogwaro", "sore throat"),
+            ("makogwaro yana ciwo", "sore throat"),
+            ("ciwon gwiwa", "joint pain"),
+            ("gwiwa yana ciwo", "joint pain"),
             
             # Diarrhea & Vomiting
-            "gudawa": "diarrhea",
-            "gudawa mai tsanani": "severe diarrhea",
-            "gudawa mai jini": "bloody diarrhea",
-            "amai": "vomiting",
-            "amai mai tsanani": "persistent vomiting",
-            "amai mai jini": "bloody vomiting",
-            "rashin jin dadi": "nausea",
-            "jin rashin jin dadi": "nausea",
+            ("gudawa", "diarrhea"),
+            ("gudawa mai tsanani", "severe diarrhea"),
+            ("gudawa mai jini", "bloody diarrhea"),
+            ("amai", "vomiting"),
+            ("amai mai tsanani", "persistent vomiting"),
+            ("amai mai jini", "bloody vomiting"),
+            ("rashin jin dadi", "nausea"),
+            ("jin rashin jin dadi", "nausea"),
             
             # Weakness & Fatigue
-            "rashin kuzari": "weakness",
-            "rashin kuzari mai tsanani": "severe weakness",
-            "rashin karfi": "weakness",
-            "karfi ya ragu": "weakness",
-            "rashin lafiya": "fatigue",
-            "gajiya": "fatigue",
-            "rashin ƙarfi": "weakness",
+            ("rashin kuzari", "weakness"),
+            ("rashin kuzari mai tsanani", "severe weakness"),
+            ("rashin karfi", "weakness"),
+            ("karfi ya ragu", "weakness"),
+            ("rashin lafiya", "fatigue"),
+            ("gajiya", "fatigue"),
+            ("rashin ƙarfi", "weakness"),
             
             # Breathing problems
-            "wahalar numfashi": "difficulty breathing",
-            "numfashi mai wahala": "difficulty breathing",
-            "rashin numfashi": "shortness of breath",
-            "numfashi yana da wahala": "breathing difficulty",
-            "numfashi mai sauri": "fast breathing",
-            "numfashi mai tsanani": "severe breathing difficulty",
+            ("wahalar numfashi", "difficulty breathing"),
+            ("numfashi mai wahala", "difficulty breathing"),
+            ("rashin numfashi", "shortness of breath"),
+            ("numfashi yana da wahala", "breathing difficulty"),
+            ("numfashi mai sauri", "fast breathing"),
+            ("numfashi mai tsanani", "severe breathing difficulty"),
             
             # Cough
-            "tari": "cough",
-            "tari mai tsanani": "persistent cough",
-            "tari mai jini": "coughing blood",
-            "tari mara tsanani": "dry cough",
-            "tari mai tsanani": "severe cough",
+            ("tari", "cough"),
+            ("tari mai jini", "coughing blood"),
+            ("tari mara tsanani", "dry cough"),
+            ("tari mai tsanani", "severe cough"),
             
             # Loss of consciousness & Seizures
-            "rashin sani": "unconscious",
-            "rashin fahimta": "unconscious",
-            "rashin sani mai tsanani": "severe unconsciousness",
-            "girgiza": "convulsions",
-            "girgiza mai tsanani": "severe convulsions",
-            "rashin sani": "loss of consciousness",
+            ("rashin fahimta", "unconscious"),
+            ("rashin sani mai tsanani", "severe unconsciousness"),
+            ("girgiza", "convulsions"),
+            ("girgiza mai tsanani", "severe convulsions"),
+            ("rashin sani", "loss of consciousness"),
             
             # Dehydration
-            "rashin ruwa": "dehydration",
-            "rashin ruwa mai tsanani": "severe dehydration",
-            "bakin baki": "dry mouth",
-            "baki yana bushe": "dry mouth",
-            "rashin fitsari": "reduced urination",
-            "fitsari ya ragu": "reduced urination",
+            ("rashin ruwa", "dehydration"),
+            ("rashin ruwa mai tsanani", "severe dehydration"),
+            ("bakin baki", "dry mouth"),
+            ("baki yana bushe", "dry mouth"),
+            ("rashin fitsari", "reduced urination"),
+            ("fitsari ya ragu", "reduced urination"),
             
             # Bleeding
-            "zubar jini": "bleeding",
-            "jini yana zubewa": "bleeding",
-            "zubar jini mai tsanani": "severe bleeding",
-            "jini daga hanci": "nosebleed",
-            "hanci yana zubar jini": "nosebleed",
+            ("zubar jini", "bleeding"),
+            ("jini yana zubewa", "bleeding"),
+            ("zubar jini mai tsanani", "severe bleeding"),
+            ("jini daga hanci", "nosebleed"),
+            ("hanci yana zubar jini", "nosebleed"),
             
             # Skin conditions
-            "kaifi": "itching",
-            "jiki yana kaifi": "itching",
-            "rashin fata": "rash",
-            "fata tana rashin": "rash",
-            "fata tana zubewa": "skin peeling",
-            "ciwon fata": "skin abscess",
-            "fata tana ciwo": "skin abscess",
+            ("kaifi", "itching"),
+            ("jiki yana kaifi", "itching"),
+            ("rashin fata", "rash"),
+            ("fata tana rashin", "rash"),
+            ("fata tana zubewa", "skin peeling"),
+            ("ciwon fata", "skin abscess"),
+            ("fata tana ciwo", "skin abscess"),
             
             # Pregnancy related
-            "ciki": "pregnant",
-            "mata tana da ciki": "pregnant",
-            "ciki mai tsanani": "pregnancy complications",
+            ("ciki", "pregnant"),
+            ("mata tana da ciki", "pregnant"),
+            ("ciki mai tsanani", "pregnancy complications"),
             
             # General descriptions
-            "mai tsanani": "severe",
-            "mai sauƙi": "mild",
-            "da yawa": "many",
-            "mai mahimmanci": "serious",
-            "mai wahala": "severe",
-            "ya ƙara": "worsening",
-            "tun": "for",
-            "kusan": "about",
+            ("mai tsanani", "severe"),
+            ("mai sauƙi", "mild"),
+            ("da yawa", "many"),
+            ("mai mahimmanci", "serious"),
+            ("mai wahala", "severe"),
+            ("ya ƙara", "worsening"),
+            ("tun", "for"),
+            ("kusan", "about"),
             
             # Time descriptions
-            "jya": "1 day",
-            "yau": "less than 1 day",
-            "makon da ya gabata": "7 days",
-            "kwanaki kaɗan": "few days",
-            "kwanaki da yawa": "many days",
-            "yanzu": "recently"
-        }
+            ("jya", "1 day"),
+            ("yau", "less than 1 day"),
+            ("makon da ya gabata", "7 days"),
+            ("kwanaki kaɗan", "few days"),
+            ("kwanaki da yawa", "many days"),
+            ("yanzu", "recently")
+        ])
     
-    def _get_igbo_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_igbo_mappings() -> Dict[str, str]:
         """Igbo medical translations"""
-        return {
+        return build_mapping('igbo', [
             # Fever & Temperature
-            "oku": "fever",
-            "oku di elu": "high fever",
-            "ahu na-ekpo oku": "fever",
-            "oku di oke": "high fever",
-            "ahu na-ekpo": "fever",
+            ("oku", "fever"),
+            ("oku di elu", "high fever"),
+            ("ahu na-ekpo oku", "fever"),
+            ("oku di oke", "high fever"),
+            ("ahu na-ekpo", "fever"),
             
             # Pain symptoms
-            "isi": "headache",
-            "isi na-egbu mgbu": "severe headache",
-            "isi na-egbu": "headache",
-            "afo": "stomach pain",
-            "afo na-egbu mgbu": "severe abdominal pain",
-            "afo na-egbu": "stomach pain",
-            "ahu na-egbu mgbu": "body aches",
-            "ahu na-egbu": "body pain",
-            "obi na-egbu mgbu": "chest pain",
-            "obi na-egbu": "chest pain",
-            "azu na-egbu mgbu": "back pain",
-            "azu na-egbu": "back pain",
-            "akpiri na-egbu mgbu": "sore throat",
-            "akpiri na-egbu": "sore throat",
-            "ukwu na-egbu mgbu": "joint pain",
-            "ukwu na-egbu": "joint pain",
+            ("isi", "headache"),
+            ("isi na-egbu mgbu", "severe headache"),
+            ("isi na-egbu", "headache"),
+            ("afo", "stomach pain"),
+            ("afo na-egbu mgbu", "severe abdominal pain"),
+            ("afo na-egbu", "stomach pain"),
+            ("ahu na-egbu mgbu", "body aches"),
+            ("ahu na-egbu", "body pain"),
+            ("obi na-egbu mgbu", "chest pain"),
+            ("obi na-egbu", "chest pain"),
+            ("azu na-egbu mgbu", "back pain"),
+            ("azu na-egbu", "back pain"),
+            ("akpiri na-egbu mgbu", "sore throat"),
+            ("akpiri na-egbu", "sore throat"),
+            ("ukwu na-egbu mgbu", "joint pain"),
+            ("ukwu na-egbu", "joint pain"),
             
             # Diarrhea & Vomiting
-            "mgbawa": "diarrhea",
-            "mgbawa di oke": "severe diarrhea",
-            "mgbawa nwere obara": "bloody diarrhea",
-            "agba": "vomiting",
-            "agba di oke": "persistent vomiting",
-            "agba nwere obara": "bloody vomiting",
-            "agba na-adi": "nausea",
-            "agba na-adi mgbu": "nausea",
+            ("mgbawa", "diarrhea"),
+            ("mgbawa di oke", "severe diarrhea"),
+            ("mgbawa nwere obara", "bloody diarrhea"),
+            ("agba", "vomiting"),
+            ("agba di oke", "persistent vomiting"),
+            ("agba nwere obara", "bloody vomiting"),
+            ("agba na-adi", "nausea"),
+            ("agba na-adi mgbu", "nausea"),
             
             # Weakness & Fatigue
-            "adighi ike": "weakness",
-            "adighi ike nke ukwuu": "severe weakness",
-            "ike adighi": "weakness",
-            "ike na-ebelata": "weakness",
-            "adighi ume": "fatigue",
-            "ume na-ebelata": "fatigue",
-            "adighi ike": "weakness",
+            ("adighi ike nke ukwuu", "severe weakness"),
+            ("ike adighi", "weakness"),
+            ("ike na-ebelata", "weakness"),
+            ("adighi ume", "fatigue"),
+            ("ume na-ebelata", "fatigue"),
+            ("adighi ike", "weakness"),
             
             # Breathing problems
-            "nsogbu iku ume": "difficulty breathing",
-            "iku ume na-esi ike": "difficulty breathing",
-            "adighi iku ume": "shortness of breath",
-            "iku ume na-esi ike": "breathing difficulty",
-            "iku ume na-adi ngwa": "fast breathing",
-            "iku ume di oke": "severe breathing difficulty",
+            ("nsogbu iku ume", "difficulty breathing"),
+            ("adighi iku ume", "shortness of breath"),
+            ("iku ume na-esi ike", "breathing difficulty"),
+            ("iku ume na-adi ngwa", "fast breathing"),
+            ("iku ume di oke", "severe breathing difficulty"),
             
             # Cough
-            "ukwu": "cough",
-            "ukwu di oke": "persistent cough",
-            "ukwu nwere obara": "coughing blood",
-            "ukwu na-adi": "dry cough",
-            "ukwu di oke": "severe cough",
+            ("ukwu", "cough"),
+            ("ukwu nwere obara", "coughing blood"),
+            ("ukwu na-adi", "dry cough"),
+            ("ukwu di oke", "severe cough"),
             
             # Loss of consciousness & Seizures
-            "adighi ama": "unconscious",
-            "adighi mata": "unconscious",
-            "adighi ama nke ukwuu": "severe unconsciousness",
-            "mgba": "convulsions",
-            "mgba di oke": "severe convulsions",
-            "adighi ama": "loss of consciousness",
+            ("adighi mata", "unconscious"),
+            ("adighi ama nke ukwuu", "severe unconsciousness"),
+            ("mgba", "convulsions"),
+            ("mgba di oke", "severe convulsions"),
+            ("adighi ama", "loss of consciousness"),
             
             # Dehydration
-            "adighi mmiri": "dehydration",
-            "adighi mmiri nke ukwuu": "severe dehydration",
-            "onu na-akpo": "dry mouth",
-            "onu na-akpo nkpo": "dry mouth",
-            "adighi mmamiri": "reduced urination",
-            "mmamiri na-ebelata": "reduced urination",
+            ("adighi mmiri", "dehydration"),
+            ("adighi mmiri nke ukwuu", "severe dehydration"),
+            ("onu na-akpo", "dry mouth"),
+            ("onu na-akpo nkpo", "dry mouth"),
+            ("adighi mmamiri", "reduced urination"),
+            ("mmamiri na-ebelata", "reduced urination"),
             
             # Bleeding
-            "obara na-agba": "bleeding",
-            "obara na-agba nke ukwuu": "severe bleeding",
-            "obara site na imi": "nosebleed",
-            "imi na-agba obara": "nosebleed",
+            ("obara na-agba", "bleeding"),
+            ("obara na-agba nke ukwuu", "severe bleeding"),
+            ("obara site na imi", "nosebleed"),
+            ("imi na-agba obara", "nosebleed"),
             
             # Skin conditions
-            "akpukpo na-akpo": "itching",
-            "akpukpo na-akpo nkpo": "itching",
-            "akpukpo na-adi": "rash",
-            "akpukpo na-adi nke ukwuu": "severe rash",
-            "akpukpo na-agba": "skin peeling",
-            "akpukpo na-egbu mgbu": "skin abscess",
-            "akpukpo na-egbu": "skin abscess",
+            ("akpukpo na-akpo", "itching"),
+            ("akpukpo na-akpo nkpo", "itching"),
+            ("akpukpo na-adi", "rash"),
+            ("akpukpo na-adi nke ukwuu", "severe rash"),
+            ("akpukpo na-agba", "skin peeling"),
+            ("akpukpo na-egbu mgbu", "skin abscess"),
+            ("akpukpo na-egbu", "skin abscess"),
             
             # Pregnancy related
-            "ime": "pregnant",
-            "nwanyi na-eme ime": "pregnant",
-            "ime di oke": "pregnancy complications",
+            ("ime", "pregnant"),
+            ("nwanyi na-eme ime", "pregnant"),
+            ("ime di oke", "pregnancy complications"),
             
             # General descriptions
-            "di oke": "severe",
-            "di mfe": "mild",
-            "di otutu": "many",
-            "di nkpa": "serious",
-            "di ike": "severe",
-            "na-abawanye": "worsening",
-            "kemgbe": "for",
-            "ihe dika": "about",
+            ("di oke", "severe"),
+            ("di mfe", "mild"),
+            ("di otutu", "many"),
+            ("di nkpa", "serious"),
+            ("di ike", "severe"),
+            ("na-abawanye", "worsening"),
+            ("kemgbe", "for"),
+            ("ihe dika", "about"),
             
             # Time descriptions
-            "unyahu": "1 day",
-            "taa": "less than 1 day",
-            "izu gara aga": "7 days",
-            "ubochi ole na ole": "few days",
-            "ubochi otutu": "many days",
-            "ugbua": "recently"
-        }
+            ("unyahu", "1 day"),
+            ("taa", "less than 1 day"),
+            ("izu gara aga", "7 days"),
+            ("ubochi ole na ole", "few days"),
+            ("ubochi otutu", "many days"),
+            ("ugbua", "recently")
+        ])
     
-    def _get_yoruba_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_yoruba_mappings() -> Dict[str, str]:
         """Yoruba medical translations"""
-        return {
+        return build_mapping('yoruba', [
             # Fever & Temperature
-            "ibà": "fever",
-            "ibà giga": "high fever",
-            "ara n gbona": "fever",
-            "ibà to gaju": "high fever",
-            "ara n gbona pupo": "fever",
+            ("ibà", "fever"),
+            ("ibà giga", "high fever"),
+            ("ara n gbona", "fever"),
+            ("ibà to gaju", "high fever"),
+            ("ara n gbona pupo", "fever"),
             
             # Pain symptoms
-            "ori": "headache",
-            "ori n dun": "severe headache",
-            "ori n dun gidigidi": "severe headache",
-            "ikun": "stomach pain",
-            "ikun n dun": "severe abdominal pain",
-            "ikun n dun gidigidi": "severe abdominal pain",
-            "ara n dun": "body aches",
-            "ara n dun gidigidi": "body pain",
-            "aya n dun": "chest pain",
-            "aya n dun gidigidi": "chest pain",
-            "eyin n dun": "back pain",
-            "eyin n dun gidigidi": "back pain",
-            "ofun n dun": "sore throat",
-            "ofun n dun gidigidi": "sore throat",
-            "egbon n dun": "joint pain",
-            "egbon n dun gidigidi": "joint pain",
+            ("ori", "headache"),
+            ("ori n dun", "severe headache"),
+            ("ori n dun gidigidi", "severe headache"),
+            ("ikun", "stomach pain"),
+            ("ikun n dun", "severe abdominal pain"),
+            ("ikun n dun gidigidi", "severe abdominal pain"),
+            ("ara n dun", "body aches"),
+            ("ara n dun gidigidi", "body pain"),
+            ("aya n dun", "chest pain"),
+            ("aya n dun gidigidi", "chest pain"),
+            ("eyin n dun", "back pain"),
+            ("eyin n dun gidigidi", "back pain"),
+            ("ofun n dun", "sore throat"),
+            ("ofun n dun gidigidi", "sore throat"),
+            ("egbon n dun", "joint pain"),
+            ("egbon n dun gidigidi", "joint pain"),
             
             # Diarrhea & Vomiting
-            "ìtọ": "diarrhea",
-            "ìtọ to gaju": "severe diarrhea",
-            "ìtọ to ni eje": "bloody diarrhea",
-            "ikọ": "vomiting",
-            "ikọ to gaju": "persistent vomiting",
-            "ikọ to ni eje": "bloody vomiting",
-            "ikọ n wa": "nausea",
-            "ikọ n wa gidigidi": "nausea",
+            ("ìtọ", "diarrhea"),
+            ("ìtọ to gaju", "severe diarrhea"),
+            ("ìtọ to ni eje", "bloody diarrhea"),
+            ("ikọ n wa gidigidi", "nausea"),
             
             # Weakness & Fatigue
-            "alailera": "weakness",
-            "alailera to gaju": "severe weakness",
-            "alailera": "weakness",
-            "agbara n dinku": "weakness",
-            "alailera": "fatigue",
-            "agbara n dinku": "fatigue",
-            "alailera": "weakness",
+            ("alailera to gaju", "severe weakness"),
+            ("agbara n dinku", "fatigue"),
+            ("alailera", "weakness"),
             
             # Breathing problems
-            "ipalara emi": "difficulty breathing",
-            "emi n le": "difficulty breathing",
-            "ipalara emi": "shortness of breath",
-            "emi n le gidigidi": "breathing difficulty",
-            "emi n yara": "fast breathing",
-            "emi n le to gaju": "severe breathing difficulty",
+            ("emi n le", "difficulty breathing"),
+            ("ipalara emi", "shortness of breath"),
+            ("emi n le gidigidi", "breathing difficulty"),
+            ("emi n yara", "fast breathing"),
+            ("emi n le to gaju", "severe breathing difficulty"),
             
             # Cough
-            "ikọ": "cough",
-            "ikọ to gaju": "persistent cough",
-            "ikọ to ni eje": "coughing blood",
-            "ikọ n wa": "dry cough",
-            "ikọ to gaju": "severe cough",
+            ("ikọ", "cough"),
+            ("ikọ to ni eje", "coughing blood"),
+            ("ikọ n wa", "dry cough"),
+            ("ikọ to gaju", "severe cough"),
             
             # Loss of consciousness & Seizures
-            "ailera": "unconscious",
-            "ailera": "unconscious",
-            "ailera to gaju": "severe unconsciousness",
-            "gbigbe": "convulsions",
-            "gbigbe to gaju": "severe convulsions",
-            "ailera": "loss of consciousness",
+            ("ailera to gaju", "severe unconsciousness"),
+            ("gbigbe", "convulsions"),
+            ("gbigbe to gaju", "severe convulsions"),
+            ("ailera", "loss of consciousness"),
             
             # Dehydration
-            "ailera omi": "dehydration",
-            "ailera omi to gaju": "severe dehydration",
-            "enu n gbe": "dry mouth",
-            "enu n gbe gidigidi": "dry mouth",
-            "ailera isin": "reduced urination",
-            "isin n dinku": "reduced urination",
+            ("ailera omi", "dehydration"),
+            ("ailera omi to gaju", "severe dehydration"),
+            ("enu n gbe", "dry mouth"),
+            ("enu n gbe gidigidi", "dry mouth"),
+            ("ailera isin", "reduced urination"),
+            ("isin n dinku", "reduced urination"),
             
             # Bleeding
-            "eje n ja": "bleeding",
-            "eje n ja to gaju": "severe bleeding",
-            "eje lati inu imu": "nosebleed",
-            "imu n ja eje": "nosebleed",
+            ("eje n ja", "bleeding"),
+            ("eje n ja to gaju", "severe bleeding"),
+            ("eje lati inu imu", "nosebleed"),
+            ("imu n ja eje", "nosebleed"),
             
             # Skin conditions
-            "ara n ka": "itching",
-            "ara n ka gidigidi": "itching",
-            "ara n yi": "rash",
-            "ara n yi to gaju": "severe rash",
-            "ara n bo": "skin peeling",
-            "ara n dun": "skin abscess",
-            "ara n dun gidigidi": "skin abscess",
+            ("ara n ka", "itching"),
+            ("ara n ka gidigidi", "itching"),
+            ("ara n yi", "rash"),
+            ("ara n yi to gaju", "severe rash"),
+            ("ara n bo", "skin peeling"),
             
             # Pregnancy related
-            "oyun": "pregnant",
-            "obinrin n oyun": "pregnant",
-            "oyun to gaju": "pregnancy complications",
+            ("oyun", "pregnant"),
+            ("obinrin n oyun", "pregnant"),
+            ("oyun to gaju", "pregnancy complications"),
             
             # General descriptions
-            "to gaju": "severe",
-            "toto": "mild",
-            "pupo": "many",
-            "pataki": "serious",
-            "le": "severe",
-            "n pọ": "worsening",
-            "lati": "for",
-            "nipa": "about",
+            ("to gaju", "severe"),
+            ("toto", "mild"),
+            ("pupo", "many"),
+            ("pataki", "serious"),
+            ("le", "severe"),
+            ("n pọ", "worsening"),
+            ("lati", "for"),
+            ("nipa", "about"),
             
             # Time descriptions
-            "ana": "1 day",
-            "oni": "less than 1 day",
-            "ose ti koja": "7 days",
-            "ojo die": "few days",
-            "ojo pupo": "many days",
-            "bayi": "recently"
-        }
+            ("ana", "1 day"),
+            ("oni", "less than 1 day"),
+            ("ose ti koja", "7 days"),
+            ("ojo die", "few days"),
+            ("ojo pupo", "many days"),
+            ("bayi", "recently")
+        ])
     
     def detect_language(self, text: str) -> Optional[str]:
         """
@@ -498,25 +539,27 @@ class MultilingualTranslator:
         if not text:
             return None
         
-        text_lower = text.lower()
-        
-        # Count matches for each language
-        language_scores = {}
-        
-        for lang, patterns in self.language_patterns.items():
-            score = 0
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    score += 1
-            language_scores[lang] = score
+        text_lower = fold(text)
         
-        # Return language with highest score
-        if language_scores:
-            best_lang = max(language_scores, key=language_scores.get)
-            if language_scores[best_lang] > 0:
-                return best_lang
+        # Score = number of distinct keywords of each language present
+        keyword_languages = self._keyword_languages
+        scores = [0] * len(self._language_ids)
+        tokens = set(_WORD_RE.findall(text_lower))
+        remaining = len(tokens)
+        for token in tokens:
+            remaining -= 1
+            lang_id = keyword_languages.get(token)
+            if lang_id is not None:
+                scores[lang_id] += 1
+                # Stop once the leader is ahead by more than the tokens left,
+                # since no other language could then catch up or tie
+                lead = scores[lang_id] - max(scores[:lang_id] + scores[lang_id + 1:])
+                if lead > remaining:
+                    break
         
-        return None
+        # Return language with highest score (ties go to the earlier language)
+        best_score = max(scores)
+        return self._language_ids[scores.index(best_score)] if best_score else None
     
     def translate_symptoms(self, symptoms: List[str]) -> Tuple[List[str], Dict[str, str]]:
         """
@@ -528,25 +571,69 @@ class MultilingualTranslator:
         Returns:
             Tuple of (translated_symptoms, translation_map)
         """
-        translated_symptoms = []
-        translation_map = {}
-        
-        for symptom in symptoms:
-            # Detect language
+        translated_symptoms, translation_map = self._translate_symptoms_cached(tuple(symptoms))
+        # Copies, so callers cannot mutate the cached result
+        return list(translated_symptoms), dict(translation_map)
+    
+    def _translate_symptom_tuple(self, symptoms: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+        """Uncached body of translate_symptoms, keyed on a hashable tuple"""
+        # Group symptoms by detected language so each language's phrases are
+        # matched against the whole group in one scan
+        by_language = {}
+        for index, symptom in enumerate(symptoms):
             detected_lang = self.detect_language(symptom)
-            
-            if detected_lang and detected_lang in self.languages:
-                # Translate using detected language
-                translated, changes = self._translate_with_language(symptom, detected_lang)
-                translated_symptoms.append(translated)
-                
-                if changes:
-                    translation_map[symptom] = translated
-            else:
-                # No translation needed (already English)
-                translated_symptoms.append(symptom)
-        
-        return translated_symptoms, translation_map
+            if detected_lang in self.languages:
+                by_language.setdefault(detected_lang, []).append(index)
+        
+        # Symptoms with no detected language need no translation (already English)
+        translated_symptoms = list(symptoms)
+        changed = [False] * len(symptoms)
+        for language, indices in by_language.items():
+            results = self._translate_batch([symptoms[i] for i in indices], language)
+            for index, (translated, was_changed) in zip(indices, results):
+                translated_symptoms[index] = translated
+                changed[index] = was_changed
+        
+        translation_map = {
+            symptom: translated
+            for symptom, translated, was_changed in zip(symptoms, translated_symptoms, changed)
+            if was_changed
+        }
+        return tuple(translated_symptoms), translation_map
+    
+    def _translate_batch(self, texts: List[str], language: str) -> List[Tuple[str, bool]]:
+        """
+        Translate several texts of one language in a single scan
+        
+        The texts are joined with a separator no phrase contains, matched
+        once, and split apart again.
+        
+        Returns:
+            List of (translated_text, changed) per input text
+        """
+        joined = _BATCH_SEPARATOR.join(texts)
+        joined_lower = joined.casefold()
+        if (len(texts) == 1 or len(joined_lower) != len(joined)
+                or joined.count(_BATCH_SEPARATOR) != len(texts) - 1
+                or not unicodedata.is_normalized('NFC', joined)):
+            results = [self._translate_with_language(text, language) for text in texts]
+            return [(translated, bool(changes)) for translated, changes in results]
+        
+        # Offset at which each text starts inside the joined string
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+        
+        mappings = self.languages[language]
+        changed = [False] * len(texts)
+        parts = []
+        pos = 0
+        for start, end, phrase in self._matchers[language].spans(joined_lower):
+            parts.append(joined[pos:start])
+            parts.append(mappings[phrase])
+            pos = end
+            changed[bisect_right(starts, start) - 1] = True
+        parts.append(joined[pos:])
+        
+        return list(zip(''.join(parts).split(_BATCH_SEPARATOR), changed))
     
     def _translate_with_language(self, text: str, language: str) -> Tuple[str, List[str]]:
         """
@@ -562,25 +649,23 @@ class MultilingualTranslator:
         if language not in self.languages:
             return text, []
         
-        mappings = self.languages[language]
-        original_text = text
-        text_lower = text.lower()
-        translations_made = []
-        
-        # Sort phrases by length (longest first) to handle multi-word phrases
-        sorted_phrases = sorted(mappings.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        # Replace each phrase
-        for phrase, english in sorted_phrases:
-            if phrase in text_lower:
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-                if pattern.search(text_lower):
-                    text = pattern.sub(english, text, count=1)
-                    text_lower = text.lower()
-                    translations_made.append(f"'{phrase}' → '{english}'")
-        
-        return text, translations_made
+        return self._matchers[language].translate(text)
+    
+    def translate_any(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Translate phrases from every supported language in a single pass
+        
+        Skips language detection, so mixed-language text such as
+        "body dey hot, ciwon kai" is translated with one scan instead of
+        one per language.
+        
+        Args:
+            text: Text to translate
+        
+        Returns:
+            Tuple of (translated_text, list_of_translations_made)
+        """
+        return self._matchers[_ALL_LANGUAGES].translate(text)
     
     def get_translation_summary(self, translation_map: Dict[str, str]) -> str:
         """
@@ -595,9 +680,10 @@ class MultilingualTranslator:
         if not translation_map:
             return "No translations needed (standard English)"
         
-        summary = "Translated from Nigerian languages:\n"
-        for original, translated in translation_map.items():
-            summary += f"  • '{original}' → '{translated}'\n"
+        summary = "Translated from Nigerian languages:\n" + "".join(
+            f"  • '{original}' → '{translated}'\n"
+            for original, translated in translation_map.items()
+        )
         
         return summary.strip()
 
@@ -4,21 +4,83 @@ Improved Igbo and Yoruba detection accuracy
 """
 
 import re
+from bisect import bisect_right
+from functools import cache, lru_cache
+from itertools import accumulate
+from types import MappingProxyType
 from typing import List, Dict, Tuple, Optional
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from phrase_matching import LazyMatchers, build_mapping, fold
+
+DETECT_CACHE_SIZE = 4096
+TRANSLATE_CACHE_SIZE = 1024
+
+# Weight of a context-pattern hit relative to a core detection pattern
+CONTEXT_WEIGHT = 0.5
+
+# Detection scores for all languages are packed into one int, one
+# fixed-width lane per language, so a keyword hit is a single addition.
+# Weights are stored in half-point units so every lane holds an integer.
+_SCORE_UNITS = 2
+_LANE_BITS = 32
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
+_WORD_RE = re.compile(r'\w+')
+
+# Shape of a two-word keyword once r'\s+' is written as one space
+_WORD_PAIR_RE = re.compile(r'(\w+)[- ](\w+)')
+
+# Joins texts for batch detection; a non-word character, so keyword
+# boundaries at either side of it behave like the ends of a text
+_BATCH_SEPARATOR = '\x1f'
+
+def _is_word_char(char: str) -> bool:
+    """Same test as regex \\w on str patterns"""
+    return char.isalnum() or char == '_'
+
 class EnhancedMultilingualTranslator:
     """Enhanced translator with improved Igbo and Yoruba detection"""
     
     def __init__(self):
-        self.languages = {
-            'pidgin': self._get_pidgin_mappings(),
-            'hausa': self._get_hausa_mappings(),
-            'igbo': self._get_igbo_mappings(),
-            'yoruba': self._get_yoruba_mappings()
-        }
+        # Mappings, detection tables and compiled matchers are built once per
+        # process and shared by every instance (they are never mutated)
+        (self.languages, self.language_patterns, self.context_patterns,
+         self._token_weights, self._pair_weights, self._keyword_automaton,
+         self._matchers) = self._build_tables()
+        
+        # Intake complaints repeat ("body dey hot"), and the translator is
+        # read-only after construction, so detection and per-symptom
+        # translation are cached per instance (detection on the folded text,
+        # which also serves differently-cased repeats)
+        self._detect_folded = lru_cache(maxsize=DETECT_CACHE_SIZE)(self._detect_folded)
+        self._translate_cached = lru_cache(maxsize=TRANSLATE_CACHE_SIZE)(
+            self._translate_uncached
+        )
+    
+    @classmethod
+    @cache
+    def _build_tables(cls):
+        """Build the mapping and detection tables shared by all instances"""
+        # Shared by every instance, so handed out as read-only views
+        languages = MappingProxyType({
+            'pidgin': MappingProxyType(cls._get_pidgin_mappings()),
+            'hausa': MappingProxyType(cls._get_hausa_mappings()),
+            'igbo': MappingProxyType(cls._get_igbo_mappings()),
+            'yoruba': MappingProxyType(cls._get_yoruba_mappings())
+        })
+        
+        # Each language's phrases compiled into a trie regex (or automaton) on
+        # first use, for single-pass longest-match translation
+        matchers = LazyMatchers(languages)
         
         # Enhanced language detection patterns with more comprehensive coverage
-        self.language_patterns = {
+        language_patterns = {
             'pidgin': [
                 r'\bdey\b', r'\bdon\b', r'\bfit\b', r'\bcomot\b', r'\bbelle\b',
                 r'\bwan\b', r'\bna\b', r'\bim\b', r'\be\b', r'\bno\b'
@@ -52,7 +114,7 @@ class EnhancedMultilingualTranslator:
         }
         
         # Additional context patterns for better detection
-        self.context_patterns = {
+        context_patterns = {
             'igbo': [
                 r'\bkemgbe\b', r'\bunyahu\b', r'\btaa\b', r'\bizu\b', r'\bubochi\b',
                 r'\bmgbe\b', r'\bnaani\b', r'\bma\b', r'\bka\b', r'\bga\b'
@@ -62,655 +124,683 @@ class EnhancedMultilingualTranslator:
                 r'\bbayi\b', r'\bnipa\b', r'\bkoja\b', r'\bdie\b', r'\bpupo\b'
             ]
         }
+        
+        # Packed per-language score increment for each keyword (see
+        # _LANE_BITS); a keyword listed for several languages or as both a
+        # core and a context word carries all of its weights at once
+        lane_ids = {lang: lang_id for lang_id, lang in enumerate(language_patterns)}
+        keyword_scores = {}
+        for weight, pattern_sets in ((1, language_patterns), (CONTEXT_WEIGHT, context_patterns)):
+            for lang, patterns in pattern_sets.items():
+                for pattern in patterns:
+                    increment = int(weight * _SCORE_UNITS) << (_LANE_BITS * lane_ids[lang])
+                    keyword_scores[pattern] = keyword_scores.get(pattern, 0) + increment
+        
+        # Without the automaton, keywords are scored by dict lookups on the
+        # tokens: single words per token, and the hyphenated and multi-word
+        # ones ("na-egbu", r"n\s+dun") per pair of adjacent tokens
+        token_weights = {}
+        pair_weights = {}
+        for pattern, increment in keyword_scores.items():
+            body = pattern[2:-2]
+            if _WORD_RE.fullmatch(body):
+                token_weights[body] = token_weights.get(body, 0) + increment
+                continue
+            keyword = body.replace(r'\s+', ' ')
+            if not _WORD_PAIR_RE.fullmatch(keyword):
+                raise ValueError(f"Unsupported detection pattern: {pattern}")
+            pair_weights[keyword] = pair_weights.get(keyword, 0) + increment
+        
+        # Every keyword of every language in one Aho-Corasick automaton, so
+        # detection is a single pass over the text (optional: needs
+        # pyahocorasick). r'\s+' inside a pattern becomes one space, and the
+        # text's whitespace runs are collapsed to match.
+        keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton_scores = {}
+            for pattern, increment in keyword_scores.items():
+                keyword = pattern[2:-2].replace(r'\s+', ' ')
+                automaton_scores[keyword] = automaton_scores.get(keyword, 0) + increment
+            keyword_automaton = ahocorasick.Automaton()
+            for keyword, increment in automaton_scores.items():
+                keyword_automaton.add_word(keyword, (len(keyword), increment))
+            keyword_automaton.make_automaton()
+        
+        return (languages, language_patterns, context_patterns,
+                token_weights, pair_weights, keyword_automaton, matchers)
     
-    def _get_pidgin_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_pidgin_mappings() -> Dict[str, str]:
         """Pidgin English medical translations"""
-        return {
+        return build_mapping('pidgin', [
             # Fever & Temperature
-            "body dey hot": "fever",
-            "body dey burn": "high fever",
-            "temperature high": "fever",
-            "e dey hot": "fever",
-            "im body hot": "fever",
-            "hot body": "fever",
+            ("body dey hot", "fever"),
+            ("body dey burn", "high fever"),
+            ("temperature high", "fever"),
+            ("e dey hot", "fever"),
+            ("im body hot", "fever"),
+            ("hot body", "fever"),
             
             # Pain symptoms
-            "head dey pain me": "headache",
-            "head dey hammer me": "severe headache",
-            "my head dey burst": "severe headache",
-            "belle dey pain": "stomach pain",
-            "belle dey pain me": "abdominal pain",
-            "stomach dey do me": "stomach pain",
-            "body dey pain": "body aches",
-            "body dey ache": "body pain",
-            "chest dey pain": "chest pain",
-            "back dey pain": "back pain",
-            "throat dey pain": "sore throat",
-            "joint dey pain": "joint pain",
+            ("head dey pain me", "headache"),
+            ("head dey hammer me", "severe headache"),
+            ("my head dey burst", "severe headache"),
+            ("belle dey pain", "stomach pain"),
+            ("belle dey pain me", "abdominal pain"),
+            ("stomach dey do me", "stomach pain"),
+            ("body dey pain", "body aches"),
+            ("body dey ache", "body pain"),
+            ("chest dey pain", "chest pain"),
+            ("back dey pain", "back pain"),
+            ("throat dey pain", "sore throat"),
+            ("joint dey pain", "joint pain"),
             
             # Diarrhea & Vomiting
-            "shit dey run": "diarrhea",
-            "belle dey run": "diarrhea",
-            "shit dey comot": "diarrhea",
-            "running belle": "diarrhea",
-            "purge": "diarrhea",
-            "e dey purge": "diarrhea",
-            "e dey vomit": "vomiting",
-            "im dey throw up": "vomiting",
-            "e wan comot": "nausea",
-            "belle wan comot": "nausea",
+            ("shit dey run", "diarrhea"),
+            ("belle dey run", "diarrhea"),
+            ("shit dey comot", "diarrhea"),
+            ("running belle", "diarrhea"),
+            ("purge", "diarrhea"),
+            ("e dey purge", "diarrhea"),
+            ("e dey vomit", "vomiting"),
+            ("im dey throw up", "vomiting"),
+            ("e wan comot", "nausea"),
+            ("belle wan comot", "nausea"),
             
             # Weakness & Fatigue
-            "body no get power": "weakness",
-            "body weak": "fatigue",
-            "no strength": "weakness",
-            "e no fit stand": "severe weakness",
-            "im body don weak": "fatigue",
-            "no energy": "fatigue",
-            "body don tire": "exhaustion",
+            ("body no get power", "weakness"),
+            ("body weak", "fatigue"),
+            ("no strength", "weakness"),
+            ("e no fit stand", "severe weakness"),
+            ("im body don weak", "fatigue"),
+            ("no energy", "fatigue"),
+            ("body don tire", "exhaustion"),
             
             # Breathing problems
-            "i no fit breathe well": "difficulty breathing",
-            "breath dey hard": "difficulty breathing",
-            "chest dey tight": "chest tightness",
-            "e no fit breath": "respiratory distress",
-            "breath dey fast": "fast breathing",
+            ("i no fit breathe well", "difficulty breathing"),
+            ("breath dey hard", "difficulty breathing"),
+            ("chest dey tight", "chest tightness"),
+            ("e no fit breath", "respiratory distress"),
+            ("breath dey fast", "fast breathing"),
             
             # Cough
-            "cough dey worry me": "persistent cough",
-            "e dey cough": "coughing",
-            "im dey cough blood": "coughing blood",
-            "dry cough": "dry cough",
+            ("cough dey worry me", "persistent cough"),
+            ("e dey cough", "coughing"),
+            ("im dey cough blood", "coughing blood"),
+            ("dry cough", "dry cough"),
             
             # Loss of consciousness & Seizures
-            "e don faint": "unconscious",
-            "e loss consciousness": "unconscious",
-            "im body dey shake": "convulsions",
-            "e dey shake": "seizures",
-            "fit dey catch am": "seizures",
+            ("e don faint", "unconscious"),
+            ("e loss consciousness", "unconscious"),
+            ("im body dey shake", "convulsions"),
+            ("e dey shake", "seizures"),
+            ("fit dey catch am", "seizures"),
             
             # Dehydration
-            "eye don sink": "sunken eyes",
-            "mouth dry": "dry mouth",
-            "no urine": "reduced urination",
-            "body don dry": "dehydration",
+            ("eye don sink", "sunken eyes"),
+            ("mouth dry", "dry mouth"),
+            ("no urine", "reduced urination"),
+            ("body don dry", "dehydration"),
             
             # Bleeding
-            "blood dey comot": "bleeding",
-            "blood dey run": "bleeding",
-            "im dey shit blood": "bloody stool",
-            "blood dey come from nose": "nosebleed",
+            ("blood dey comot", "bleeding"),
+            ("blood dey run", "bleeding"),
+            ("im dey shit blood", "bloody stool"),
+            ("blood dey come from nose", "nosebleed"),
             
             # Skin conditions
-            "body dey scratch": "itching",
-            "rash dey": "rash",
-            "skin dey peel": "skin peeling",
-            "boil": "skin abscess",
+            ("body dey scratch", "itching"),
+            ("rash dey", "rash"),
+            ("skin dey peel", "skin peeling"),
+            ("boil", "skin abscess"),
             
             # Pregnancy related
-            "belle": "pregnant",
-            "im get belle": "pregnant",
-            "pregnancy": "pregnant",
+            ("belle", "pregnant"),
+            ("im get belle", "pregnant"),
+            ("pregnancy", "pregnant"),
             
             # General descriptions
-            "very bad": "severe",
-            "small small": "mild",
-            "plenty": "many",
-            "no be small": "serious",
-            "e serious": "severe",
-            "e don worse": "worsening",
-            "since": "for",
-            "done reach": "about",
+            ("very bad", "severe"),
+            ("small small", "mild"),
+            ("plenty", "many"),
+            ("no be small", "serious"),
+            ("e serious", "severe"),
+            ("e don worse", "worsening"),
+            ("since", "for"),
+            ("done reach", "about"),
             
             # Time descriptions
-            "yesterday": "1 day",
-            "today": "less than 1 day",
-            "last week": "7 days",
-            "some days": "few days",
-            "long time": "many days",
-            "just now": "recently"
-        }
+            ("yesterday", "1 day"),
+            ("today", "less than 1 day"),
+            ("last week", "7 days"),
+            ("some days", "few days"),
+            ("long time", "many days"),
+            ("just now", "recently")
+        ])
     
-    def _get_hausa_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_hausa_mappings() -> Dict[str, str]:
         """Hausa medical translations"""
-        return {
+        return build_mapping('hausa', [
             # Fever & Temperature
-            "zazzabi": "fever",
-            "zazzabi mai tsanani": "high fever",
-            "jiki yana zafi": "fever",
-            "zafi mai tsanani": "high fever",
-            "jiki yana da zafi": "fever",
+            ("zazzabi", "fever"),
+            ("zazzabi mai tsanani", "high fever"),
+            ("jiki yana zafi", "fever"),
+            ("zafi mai tsanani", "high fever"),
+            ("jiki yana da zafi", "fever"),
             
             # Pain symptoms
-            "ciwon kai": "headache",
-            "ciwon kai mai tsanani": "severe headache",
-            "kai yana ciwo": "headache",
-            "ciwon ciki": "stomach pain",
-            "ciwon ciki mai tsanani": "severe abdominal pain",
-            "ciki yana ciwo": "stomach pain",
-            "ciwon jiki": "body aches",
-            "jiki yana ciwo": "body pain",
-            "ciwon kirji": "chest pain",
-            "kirji yana ciwo": "chest pain",
-            "ciwon baya": "back pain",
-            "baya yana ciwo": "back pain",
-            "ciwon makogwaro": "sore throat",
-            "makogwaro yana ciwo": "sore throat",
-            "ciwon gwiwa": "joint pain",
-            "gwiwa yana ciwo": "joint pain",
+            ("ciwon kai", "headache"),
+            ("ciwon kai mai tsanani", "severe headache"),
+            ("kai yana ciwo", "headache"),
+            ("ciwon ciki", "stomach pain"),
+            ("ciwon ciki mai tsanani", "severe abdominal pain"),
+            ("ciki yana ciwo", "stomach pain"),
+            ("ciwon jiki", "body aches"),
+            ("jiki yana ciwo", "body pain"),
+            ("ciwon kirji", "chest pain"),
+            ("kirji yana ciwo", "chest pain"),
+            ("ciwon baya", "back pain"),
+            ("baya yana ciwo", "back pain"),
+            ("ciwon makogwaro", "sore throat"),
+            ("makogwaro yana ciwo", "sore throat"),
+            ("ciwon gwiwa", "joint pain"),
+            ("gwiwa yana ciwo", "joint pain"),
             
             # Diarrhea & Vomiting
-            "gudawa": "diarrhea",
-            "gudawa mai tsanani": "severe diarrhea",
-            "gudawa mai jini": "bloody diarrhea",
-            "amai": "vomiting",
-            "amai mai tsanani": "persistent vomiting",
-            "amai mai jini": "bloody vomiting",
-            "rashin jin dadi": "nausea",
-            "jin rashin jin dadi": "nausea",
+            ("gudawa", "diarrhea"),
+            ("gudawa mai tsanani", "severe diarrhea"),
+            ("gudawa mai jini", "bloody diarrhea"),
+            ("amai", "vomiting"),
+            ("amai mai tsanani", "persistent vomiting"),
+            ("amai mai jini", "bloody vomiting"),
+            ("rashin jin dadi", "nausea"),
+            ("jin rashin jin dadi", "nausea"),
             
             # Weakness & Fatigue
-            "rashin kuzari": "weakness",
-            "rashin kuzari mai tsanani": "severe weakness",
-            "rashin karfi": "weakness",
-            "karfi ya ragu": "weakness",
-            "rashin lafiya": "fatigue",
-            "gajiya": "fatigue",
-            "rashin ƙarfi": "weakness",
+            ("rashin kuzari", "weakness"),
+            ("rashin kuzari mai tsanani", "severe weakness"),
+            ("rashin karfi", "weakness"),
+            ("karfi ya ragu", "weakness"),
+            ("rashin lafiya", "fatigue"),
+            ("gajiya", "fatigue"),
+            ("rashin ƙarfi", "weakness"),
             
             # Breathing problems
-            "wahalar numfashi": "difficulty breathing",
-            "numfashi mai wahala": "difficulty breathing",
-            "rashin numfashi": "shortness of breath",
-            "numfashi yana da wahala": "breathing difficulty",
-            "numfashi mai sauri": "fast breathing",
-            "numfashi mai tsanani": "severe breathing difficulty",
+            ("wahalar numfashi", "difficulty breathing"),
+            ("numfashi mai wahala", "difficulty breathing"),
+            ("rashin numfashi", "shortness of breath"),
+            ("numfashi yana da wahala", "breathing difficulty"),
+            ("numfashi mai sauri", "fast breathing"),
+            ("numfashi mai tsanani", "severe breathing difficulty"),
             
             # Cough
-            "tari": "cough",
-            "tari mai tsanani": "persistent cough",
-            "tari mai jini": "coughing blood",
-            "tari mara tsanani": "dry cough",
-            "tari mai tsanani": "severe cough",
+            ("tari", "cough"),
+            ("tari mai jini", "coughing blood"),
+            ("tari mara tsanani", "dry cough"),
+            ("tari mai tsanani", "severe cough"),
             
             # Loss of consciousness & Seizures
-            "rashin sani": "unconscious",
-            "rashin fahimta": "unconscious",
-            "rashin sani mai tsanani": "severe unconsciousness",
-            "girgiza": "convulsions",
-            "girgiza mai tsanani": "severe convulsions",
-            "rashin sani": "loss of consciousness",
+            ("rashin fahimta", "unconscious"),
+            ("rashin sani mai tsanani", "severe unconsciousness"),
+            ("girgiza", "convulsions"),
+            ("girgiza mai tsanani", "severe convulsions"),
+            ("rashin sani", "loss of consciousness"),
             
             # Dehydration
-            "rashin ruwa": "dehydration",
-            "rashin ruwa mai tsanani": "severe dehydration",
-            "bakin baki": "dry mouth",
-            "baki yana bushe": "dry mouth",
-            "rashin fitsari": "reduced urination",
-            "fitsari ya ragu": "reduced urination",
+            ("rashin ruwa", "dehydration"),
+            ("rashin ruwa mai tsanani", "severe dehydration"),
+            ("bakin baki", "dry mouth"),
+            ("baki yana bushe", "dry mouth"),
+            ("rashin fitsari", "reduced urination"),
+            ("fitsari ya ragu", "reduced urination"),
             
             # Bleeding
-            "zubar jini": "bleeding",
-            "jini yana zubewa": "bleeding",
-            "zubar jini mai tsanani": "severe bleeding",
-            "jini daga hanci": "nosebleed",
-            "hanci yana zubar jini": "nosebleed",
+            ("zubar jini", "bleeding"),
+            ("jini yana zubewa", "bleeding"),
+            ("zubar jini mai tsanani", "severe bleeding"),
+            ("jini daga hanci", "nosebleed"),
+            ("hanci yana zubar jini", "nosebleed"),
             
             # Skin conditions
-            "kaifi": "itching",
-            "jiki yana kaifi": "itching",
-            "rashin fata": "rash",
-            "fata tana rashin": "rash",
-            "fata tana zubewa": "skin peeling",
-            "ciwon fata": "skin abscess",
-            "fata tana ciwo": "skin abscess",
+            ("kaifi", "itching"),
+            ("jiki yana kaifi", "itching"),
+            ("rashin fata", "rash"),
+            ("fata tana rashin", "rash"),
+            ("fata tana zubewa", "skin peeling"),
+            ("ciwon fata", "skin abscess"),
+            ("fata tana ciwo", "skin abscess"),
             
             # Pregnancy related
-            "ciki": "pregnant",
-            "mata tana da ciki": "pregnant",
-            "ciki mai tsanani": "pregnancy complications",
+            ("ciki", "pregnant"),
+            ("mata tana da ciki", "pregnant"),
+            ("ciki mai tsanani", "pregnancy complications"),
             
             # General descriptions
-            "mai tsanani": "severe",
-            "mai sauƙi": "mild",
-            "da yawa": "many",
-            "mai mahimmanci": "serious",
-            "mai wahala": "severe",
-            "ya ƙara": "worsening",
-            "tun": "for",
-            "kusan": "about",
+            ("mai tsanani", "severe"),
+            ("mai sauƙi", "mild"),
+            ("da yawa", "many"),
+            ("mai mahimmanci", "serious"),
+            ("mai wahala", "severe"),
+            ("ya ƙara", "worsening"),
+            ("tun", "for"),
+            ("kusan", "about"),
             
             # Time descriptions
-            "jya": "1 day",
-            "yau": "less than 1 day",
-            "makon da ya gabata": "7 days",
-            "kwanaki kaɗan": "few days",
-            "kwanaki da yawa": "many days",
-            "yanzu": "recently"
-        }
+            ("jya", "1 day"),
+            ("yau", "less than 1 day"),
+            ("makon da ya gabata", "7 days"),
+            ("kwanaki kaɗan", "few days"),
+            ("kwanaki da yawa", "many days"),
+            ("yanzu", "recently")
+        ])
     
-    def _get_igbo_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_igbo_mappings() -> Dict[str, str]:
         """Enhanced Igbo medical translations with more comprehensive coverage"""
-        return {
+        return build_mapping('igbo', [
             # Fever & Temperature - Enhanced
-            "oku": "fever",
-            "oku di elu": "high fever",
-            "oku di oke": "high fever",
-            "oku ukwu": "high fever",
-            "ahu na-ekpo oku": "fever",
-            "ahu na-ekpo": "fever",
-            "ahu na-ekpo ukwu": "high fever",
-            "oku na-adi": "fever",
-            "oku na-adi mgbu": "fever with pain",
+            ("oku", "fever"),
+            ("oku di elu", "high fever"),
+            ("oku di oke", "high fever"),
+            ("oku ukwu", "high fever"),
+            ("ahu na-ekpo oku", "fever"),
+            ("ahu na-ekpo", "fever"),
+            ("ahu na-ekpo ukwu", "high fever"),
+            ("oku na-adi", "fever"),
+            ("oku na-adi mgbu", "fever with pain"),
             
             # Pain symptoms - Enhanced
-            "isi": "headache",
-            "isi na-egbu mgbu": "severe headache",
-            "isi na-egbu": "headache",
-            "isi na-adi mgbu": "headache",
-            "isi na-adi": "headache",
-            "isi ukwu": "severe headache",
-            "isi na-egbu ukwu": "severe headache",
-            
-            "afo": "stomach pain",
-            "afo na-egbu mgbu": "severe abdominal pain",
-            "afo na-egbu": "stomach pain",
-            "afo na-adi mgbu": "stomach pain",
-            "afo na-adi": "stomach pain",
-            "afo ukwu": "severe stomach pain",
-            "afo na-egbu ukwu": "severe abdominal pain",
-            
-            "ahu na-egbu mgbu": "body aches",
-            "ahu na-egbu": "body pain",
-            "ahu na-adi mgbu": "body pain",
-            "ahu na-adi": "body pain",
-            "ahu ukwu": "severe body pain",
-            "ahu na-egbu ukwu": "severe body aches",
-            
-            "obi na-egbu mgbu": "chest pain",
-            "obi na-egbu": "chest pain",
-            "obi na-adi mgbu": "chest pain",
-            "obi na-adi": "chest pain",
-            "obi ukwu": "severe chest pain",
-            "obi na-egbu ukwu": "severe chest pain",
-            
-            "azu na-egbu mgbu": "back pain",
-            "azu na-egbu": "back pain",
-            "azu na-adi mgbu": "back pain",
-            "azu na-adi": "back pain",
-            "azu ukwu": "severe back pain",
-            "azu na-egbu ukwu": "severe back pain",
-            
-            "akpiri na-egbu mgbu": "sore throat",
-            "akpiri na-egbu": "sore throat",
-            "akpiri na-adi mgbu": "sore throat",
-            "akpiri na-adi": "sore throat",
-            "akpiri ukwu": "severe sore throat",
-            "akpiri na-egbu ukwu": "severe sore throat",
-            
-            "ukwu na-egbu mgbu": "joint pain",
-            "ukwu na-egbu": "joint pain",
-            "ukwu na-adi mgbu": "joint pain",
-            "ukwu na-adi": "joint pain",
-            "ukwu ukwu": "severe joint pain",
-            "ukwu na-egbu ukwu": "severe joint pain",
+            ("isi", "headache"),
+            ("isi na-egbu mgbu", "severe headache"),
+            ("isi na-egbu", "headache"),
+            ("isi na-adi mgbu", "headache"),
+            ("isi na-adi", "headache"),
+            ("isi ukwu", "severe headache"),
+            ("isi na-egbu ukwu", "severe headache"),
+            
+            ("afo", "stomach pain"),
+            ("afo na-egbu mgbu", "severe abdominal pain"),
+            ("afo na-egbu", "stomach pain"),
+            ("afo na-adi mgbu", "stomach pain"),
+            ("afo na-adi", "stomach pain"),
+            ("afo ukwu", "severe stomach pain"),
+            ("afo na-egbu ukwu", "severe abdominal pain"),
+            
+            ("ahu na-egbu mgbu", "body aches"),
+            ("ahu na-egbu", "body pain"),
+            ("ahu na-adi mgbu", "body pain"),
+            ("ahu na-adi", "body pain"),
+            ("ahu ukwu", "severe body pain"),
+            ("ahu na-egbu ukwu", "severe body aches"),
+            
+            ("obi na-egbu mgbu", "chest pain"),
+            ("obi na-egbu", "chest pain"),
+            ("obi na-adi mgbu", "chest pain"),
+            ("obi na-adi", "chest pain"),
+            ("obi ukwu", "severe chest pain"),
+            ("obi na-egbu ukwu", "severe chest pain"),
+            
+            ("azu na-egbu mgbu", "back pain"),
+            ("azu na-egbu", "back pain"),
+            ("azu na-adi mgbu", "back pain"),
+            ("azu na-adi", "back pain"),
+            ("azu ukwu", "severe back pain"),
+            ("azu na-egbu ukwu", "severe back pain"),
+            
+            ("akpiri na-egbu mgbu", "sore throat"),
+            ("akpiri na-egbu", "sore throat"),
+            ("akpiri na-adi mgbu", "sore throat"),
+            ("akpiri na-adi", "sore throat"),
+            ("akpiri ukwu", "severe sore throat"),
+            ("akpiri na-egbu ukwu", "severe sore throat"),
+            
+            ("ukwu na-egbu mgbu", "joint pain"),
+            ("ukwu na-egbu", "joint pain"),
+            ("ukwu na-egbu ukwu", "severe joint pain"),
             
             # Diarrhea & Vomiting - Enhanced
-            "mgbawa": "diarrhea",
-            "mgbawa di oke": "severe diarrhea",
-            "mgbawa di ukwu": "severe diarrhea",
-            "mgbawa nwere obara": "bloody diarrhea",
-            "mgbawa na-adi": "diarrhea",
-            "mgbawa na-adi mgbu": "painful diarrhea",
-            "mgbawa ukwu": "severe diarrhea",
-            "mgbawa na-adi ukwu": "severe diarrhea",
-            
-            "agba": "vomiting",
-            "agba di oke": "persistent vomiting",
-            "agba di ukwu": "severe vomiting",
-            "agba nwere obara": "bloody vomiting",
-            "agba na-adi": "vomiting",
-            "agba na-adi mgbu": "painful vomiting",
-            "agba ukwu": "severe vomiting",
-            "agba na-adi ukwu": "severe vomiting",
+            ("mgbawa", "diarrhea"),
+            ("mgbawa di oke", "severe diarrhea"),
+            ("mgbawa di ukwu", "severe diarrhea"),
+            ("mgbawa nwere obara", "bloody diarrhea"),
+            ("mgbawa na-adi", "diarrhea"),
+            ("mgbawa na-adi mgbu", "painful diarrhea"),
+            ("mgbawa ukwu", "severe diarrhea"),
+            ("mgbawa na-adi ukwu", "severe diarrhea"),
+            
+            ("agba", "vomiting"),
+            ("agba di oke", "persistent vomiting"),
+            ("agba di ukwu", "severe vomiting"),
+            ("agba nwere obara", "bloody vomiting"),
+            ("agba na-adi", "vomiting"),
+            ("agba na-adi mgbu", "painful vomiting"),
+            ("agba ukwu", "severe vomiting"),
+            ("agba na-adi ukwu", "severe vomiting"),
             
             # Weakness & Fatigue - Enhanced
-            "adighi ike": "weakness",
-            "adighi ike nke ukwuu": "severe weakness",
-            "adighi ike ukwu": "severe weakness",
-            "ike adighi": "weakness",
-            "ike na-ebelata": "weakness",
-            "ike na-adi": "weakness",
-            "ike ukwu": "severe weakness",
-            "ike na-adi ukwu": "severe weakness",
-            
-            "adighi ume": "fatigue",
-            "adighi ume nke ukwuu": "severe fatigue",
-            "adighi ume ukwu": "severe fatigue",
-            "ume na-ebelata": "fatigue",
-            "ume na-adi": "fatigue",
-            "ume ukwu": "severe fatigue",
-            "ume na-adi ukwu": "severe fatigue",
+            ("adighi ike", "weakness"),
+            ("adighi ike nke ukwuu", "severe weakness"),
+            ("adighi ike ukwu", "severe weakness"),
+            ("ike adighi", "weakness"),
+            ("ike na-ebelata", "weakness"),
+            ("ike na-adi", "weakness"),
+            ("ike ukwu", "severe weakness"),
+            ("ike na-adi ukwu", "severe weakness"),
+            
+            ("adighi ume", "fatigue"),
+            ("adighi ume nke ukwuu", "severe fatigue"),
+            ("adighi ume ukwu", "severe fatigue"),
+            ("ume na-ebelata", "fatigue"),
+            ("ume na-adi", "fatigue"),
+            ("ume ukwu", "severe fatigue"),
+            ("ume na-adi ukwu", "severe fatigue"),
             
             # Breathing problems - Enhanced
-            "nsogbu iku ume": "difficulty breathing",
-            "nsogbu iku ume ukwu": "severe breathing difficulty",
-            "iku ume na-esi ike": "difficulty breathing",
-            "iku ume na-esi ike ukwu": "severe breathing difficulty",
-            "adighi iku ume": "shortness of breath",
-            "adighi iku ume ukwu": "severe shortness of breath",
-            "iku ume na-adi ngwa": "fast breathing",
-            "iku ume na-adi ngwa ukwu": "very fast breathing",
-            "iku ume di oke": "severe breathing difficulty",
-            "iku ume di ukwu": "severe breathing difficulty",
+            ("nsogbu iku ume", "difficulty breathing"),
+            ("nsogbu iku ume ukwu", "severe breathing difficulty"),
+            ("iku ume na-esi ike", "difficulty breathing"),
+            ("iku ume na-esi ike ukwu", "severe breathing difficulty"),
+            ("adighi iku ume", "shortness of breath"),
+            ("adighi iku ume ukwu", "severe shortness of breath"),
+            ("iku ume na-adi ngwa", "fast breathing"),
+            ("iku ume na-adi ngwa ukwu", "very fast breathing"),
+            ("iku ume di oke", "severe breathing difficulty"),
+            ("iku ume di ukwu", "severe breathing difficulty"),
             
             # Cough - Enhanced
-            "ukwu": "cough",
-            "ukwu di oke": "persistent cough",
-            "ukwu di ukwu": "severe cough",
-            "ukwu nwere obara": "coughing blood",
-            "ukwu na-adi": "cough",
-            "ukwu na-adi mgbu": "painful cough",
-            "ukwu ukwu": "severe cough",
-            "ukwu na-adi ukwu": "severe cough",
+            ("ukwu", "cough"),
+            ("ukwu di oke", "persistent cough"),
+            ("ukwu di ukwu", "severe cough"),
+            ("ukwu nwere obara", "coughing blood"),
+            ("ukwu na-adi", "cough"),
+            ("ukwu na-adi mgbu", "painful cough"),
+            ("ukwu ukwu", "severe cough"),
+            ("ukwu na-adi ukwu", "severe cough"),
             
             # Loss of consciousness & Seizures - Enhanced
-            "adighi ama": "unconscious",
-            "adighi ama nke ukwuu": "severe unconsciousness",
-            "adighi ama ukwu": "severe unconsciousness",
-            "adighi mata": "unconscious",
-            "adighi mata nke ukwuu": "severe unconsciousness",
-            "adighi mata ukwu": "severe unconsciousness",
-            "mgba": "convulsions",
-            "mgba di oke": "severe convulsions",
-            "mgba di ukwu": "severe convulsions",
-            "mgba na-adi": "convulsions",
-            "mgba na-adi ukwu": "severe convulsions",
+            ("adighi ama", "unconscious"),
+            ("adighi ama nke ukwuu", "severe unconsciousness"),
+            ("adighi ama ukwu", "severe unconsciousness"),
+            ("adighi mata", "unconscious"),
+            ("adighi mata nke ukwuu", "severe unconsciousness"),
+            ("adighi mata ukwu", "severe unconsciousness"),
+            ("mgba", "convulsions"),
+            ("mgba di oke", "severe convulsions"),
+            ("mgba di ukwu", "severe convulsions"),
+            ("mgba na-adi", "convulsions"),
+            ("mgba na-adi ukwu", "severe convulsions"),
             
             # Dehydration - Enhanced
-            "adighi mmiri": "dehydration",
-            "adighi mmiri nke ukwuu": "severe dehydration",
-            "adighi mmiri ukwu": "severe dehydration",
-            "onu na-akpo": "dry mouth",
-            "onu na-akpo nkpo": "dry mouth",
-            "onu na-adi akpo": "dry mouth",
-            "adighi mmamiri": "reduced urination",
-            "adighi mmamiri nke ukwuu": "severely reduced urination",
-            "adighi mmamiri ukwu": "severely reduced urination",
-            "mmamiri na-ebelata": "reduced urination",
-            "mmamiri na-adi": "reduced urination",
+            ("adighi mmiri", "dehydration"),
+            ("adighi mmiri nke ukwuu", "severe dehydration"),
+            ("adighi mmiri ukwu", "severe dehydration"),
+            ("onu na-akpo", "dry mouth"),
+            ("onu na-akpo nkpo", "dry mouth"),
+            ("onu na-adi akpo", "dry mouth"),
+            ("adighi mmamiri", "reduced urination"),
+            ("adighi mmamiri nke ukwuu", "severely reduced urination"),
+            ("adighi mmamiri ukwu", "severely reduced urination"),
+            ("mmamiri na-ebelata", "reduced urination"),
+            ("mmamiri na-adi", "reduced urination"),
             
             # Bleeding - Enhanced
-            "obara na-agba": "bleeding",
-            "obara na-agba nke ukwuu": "severe bleeding",
-            "obara na-agba ukwu": "severe bleeding",
-            "obara site na imi": "nosebleed",
-            "imi na-agba obara": "nosebleed",
-            "obara na-adi": "bleeding",
-            "obara na-adi ukwu": "severe bleeding",
+            ("obara na-agba", "bleeding"),
+            ("obara na-agba nke ukwuu", "severe bleeding"),
+            ("obara na-agba ukwu", "severe bleeding"),
+            ("obara site na imi", "nosebleed"),
+            ("imi na-agba obara", "nosebleed"),
+            ("obara na-adi", "bleeding"),
+            ("obara na-adi ukwu", "severe bleeding"),
             
             # Skin conditions - Enhanced
-            "akpukpo na-akpo": "itching",
-            "akpukpo na-akpo nkpo": "itching",
-            "akpukpo na-adi akpo": "itching",
-            "akpukpo na-adi": "rash",
-            "akpukpo na-adi nke ukwuu": "severe rash",
-            "akpukpo na-adi ukwu": "severe rash",
-            "akpukpo na-agba": "skin peeling",
-            "akpukpo na-egbu mgbu": "skin abscess",
-            "akpukpo na-egbu": "skin abscess",
-            "akpukpo na-egbu ukwu": "severe skin abscess",
+            ("akpukpo na-akpo", "itching"),
+            ("akpukpo na-akpo nkpo", "itching"),
+            ("akpukpo na-adi akpo", "itching"),
+            ("akpukpo na-adi", "rash"),
+            ("akpukpo na-adi nke ukwuu", "severe rash"),
+            ("akpukpo na-adi ukwu", "severe rash"),
+            ("akpukpo na-agba", "skin peeling"),
+            ("akpukpo na-egbu mgbu", "skin abscess"),
+            ("akpukpo na-egbu", "skin abscess"),
+            ("akpukpo na-egbu ukwu", "severe skin abscess"),
             
             # Pregnancy related - Enhanced
-            "ime": "pregnant",
-            "nwanyi na-eme ime": "pregnant",
-            "ime di oke": "pregnancy complications",
-            "ime di ukwu": "pregnancy complications",
-            "ime na-adi": "pregnant",
-            "ime na-adi ukwu": "pregnancy complications",
+            ("ime", "pregnant"),
+            ("nwanyi na-eme ime", "pregnant"),
+            ("ime di oke", "pregnancy complications"),
+            ("ime di ukwu", "pregnancy complications"),
+            ("ime na-adi", "pregnant"),
+            ("ime na-adi ukwu", "pregnancy complications"),
             
             # General descriptions - Enhanced
-            "di oke": "severe",
-            "di ukwu": "severe",
-            "di mfe": "mild",
-            "di otutu": "many",
-            "di nkpa": "serious",
-            "di ike": "severe",
-            "na-abawanye": "worsening",
-            "na-adi": "is",
-            "na-adi ukwu": "is severe",
-            "kemgbe": "for",
-            "ihe dika": "about",
+            ("di oke", "severe"),
+            ("di ukwu", "severe"),
+            ("di mfe", "mild"),
+            ("di otutu", "many"),
+            ("di nkpa", "serious"),
+            ("di ike", "severe"),
+            ("na-abawanye", "worsening"),
+            ("na-adi", "is"),
+            ("na-adi ukwu", "is severe"),
+            ("kemgbe", "for"),
+            ("ihe dika", "about"),
             
             # Time descriptions - Enhanced
-            "unyahu": "1 day",
-            "taa": "less than 1 day",
-            "izu gara aga": "7 days",
-            "ubochi ole na ole": "few days",
-            "ubochi otutu": "many days",
-            "ugbua": "recently",
-            "mgbe": "when",
-            "naani": "only",
-            "ma": "but",
-            "ka": "than",
-            "ga": "will"
-        }
+            ("unyahu", "1 day"),
+            ("taa", "less than 1 day"),
+            ("izu gara aga", "7 days"),
+            ("ubochi ole na ole", "few days"),
+            ("ubochi otutu", "many days"),
+            ("ugbua", "recently"),
+            ("mgbe", "when"),
+            ("naani", "only"),
+            ("ma", "but"),
+            ("ka", "than"),
+            ("ga", "will")
+        ])
     
-    def _get_yoruba_mappings(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_yoruba_mappings() -> Dict[str, str]:
         """Enhanced Yoruba medical translations with more comprehensive coverage"""
-        return {
+        return build_mapping('yoruba', [
             # Fever & Temperature - Enhanced
-            "ibà": "fever",
-            "ibà giga": "high fever",
-            "ibà to gaju": "high fever",
-            "ibà to gaju pupo": "very high fever",
-            "ara n gbona": "fever",
-            "ara n gbona pupo": "fever",
-            "ara n gbona to gaju": "high fever",
-            "ara n gbona gidigidi": "severe fever",
+            ("ibà", "fever"),
+            ("ibà giga", "high fever"),
+            ("ibà to gaju", "high fever"),
+            ("ibà to gaju pupo", "very high fever"),
+            ("ara n gbona", "fever"),
+            ("ara n gbona pupo", "fever"),
+            ("ara n gbona to gaju", "high fever"),
+            ("ara n gbona gidigidi", "severe fever"),
             
             # Pain symptoms - Enhanced
-            "ori": "headache",
-            "ori n dun": "severe headache",
-            "ori n dun gidigidi": "severe headache",
-            "ori n dun to gaju": "severe headache",
-            "ori n dun pupo": "severe headache",
-            "ori to gaju": "severe headache",
-            "ori n dun le": "severe headache",
-            
-            "ikun": "stomach pain",
-            "ikun n dun": "severe abdominal pain",
-            "ikun n dun gidigidi": "severe abdominal pain",
-            "ikun n dun to gaju": "severe abdominal pain",
-            "ikun n dun pupo": "severe abdominal pain",
-            "ikun to gaju": "severe stomach pain",
-            "ikun n dun le": "severe abdominal pain",
-            
-            "ara n dun": "body aches",
-            "ara n dun gidigidi": "body pain",
-            "ara n dun to gaju": "severe body pain",
-            "ara n dun pupo": "severe body pain",
-            "ara to gaju": "severe body pain",
-            "ara n dun le": "severe body pain",
-            
-            "aya n dun": "chest pain",
-            "aya n dun gidigidi": "chest pain",
-            "aya n dun to gaju": "severe chest pain",
-            "aya n dun pupo": "severe chest pain",
-            "aya to gaju": "severe chest pain",
-            "aya n dun le": "severe chest pain",
-            
-            "eyin n dun": "back pain",
-            "eyin n dun gidigidi": "back pain",
-            "eyin n dun to gaju": "severe back pain",
-            "eyin n dun pupo": "severe back pain",
-            "eyin to gaju": "severe back pain",
-            "eyin n dun le": "severe back pain",
-            
-            "ofun n dun": "sore throat",
-            "ofun n dun gidigidi": "sore throat",
-            "ofun n dun to gaju": "severe sore throat",
-            "ofun n dun pupo": "severe sore throat",
-            "ofun to gaju": "severe sore throat",
-            "ofun n dun le": "severe sore throat",
-            
-            "egbon n dun": "joint pain",
-            "egbon n dun gidigidi": "joint pain",
-            "egbon n dun to gaju": "severe joint pain",
-            "egbon n dun pupo": "severe joint pain",
-            "egbon to gaju": "severe joint pain",
-            "egbon n dun le": "severe joint pain",
+            ("ori", "headache"),
+            ("ori n dun", "severe headache"),
+            ("ori n dun gidigidi", "severe headache"),
+            ("ori n dun to gaju", "severe headache"),
+            ("ori n dun pupo", "severe headache"),
+            ("ori to gaju", "severe headache"),
+            ("ori n dun le", "severe headache"),
+            
+            ("ikun", "stomach pain"),
+            ("ikun n dun", "severe abdominal pain"),
+            ("ikun n dun gidigidi", "severe abdominal pain"),
+            ("ikun n dun to gaju", "severe abdominal pain"),
+            ("ikun n dun pupo", "severe abdominal pain"),
+            ("ikun to gaju", "severe stomach pain"),
+            ("ikun n dun le", "severe abdominal pain"),
+            
+            ("ara n dun", "body aches"),
+            ("ara n dun gidigidi", "body pain"),
+            ("ara n dun to gaju", "severe body pain"),
+            ("ara n dun pupo", "severe body pain"),
+            ("ara to gaju", "severe body pain"),
+            ("ara n dun le", "severe body pain"),
+            
+            ("aya n dun", "chest pain"),
+            ("aya n dun gidigidi", "chest pain"),
+            ("aya n dun to gaju", "severe chest pain"),
+            ("aya n dun pupo", "severe chest pain"),
+            ("aya to gaju", "severe chest pain"),
+            ("aya n dun le", "severe chest pain"),
+            
+            ("eyin n dun", "back pain"),
+            ("eyin n dun gidigidi", "back pain"),
+            ("eyin n dun to gaju", "severe back pain"),
+            ("eyin n dun pupo", "severe back pain"),
+            ("eyin to gaju", "severe back pain"),
+            ("eyin n dun le", "severe back pain"),
+            
+            ("ofun n dun", "sore throat"),
+            ("ofun n dun gidigidi", "sore throat"),
+            ("ofun n dun to gaju", "severe sore throat"),
+            ("ofun n dun pupo", "severe sore throat"),
+            ("ofun to gaju", "severe sore throat"),
+            ("ofun n dun le", "severe sore throat"),
+            
+            ("egbon n dun", "joint pain"),
+            ("egbon n dun gidigidi", "joint pain"),
+            ("egbon n dun to gaju", "severe joint pain"),
+            ("egbon n dun pupo", "severe joint pain"),
+            ("egbon to gaju", "severe joint pain"),
+            ("egbon n dun le", "severe joint pain"),
             
             # Diarrhea & Vomiting - Enhanced
-            "ìtọ": "diarrhea",
-            "ìtọ to gaju": "severe diarrhea",
-            "ìtọ to gaju pupo": "very severe diarrhea",
-            "ìtọ to ni eje": "bloody diarrhea",
-            "ìtọ n wa": "diarrhea",
-            "ìtọ n wa gidigidi": "severe diarrhea",
-            "ìtọ pupo": "severe diarrhea",
-            "ìtọ n wa le": "severe diarrhea",
-            
-            "ikọ": "vomiting",
-            "ikọ to gaju": "persistent vomiting",
-            "ikọ to gaju pupo": "very severe vomiting",
-            "ikọ to ni eje": "bloody vomiting",
-            "ikọ n wa": "nausea",
-            "ikọ n wa gidigidi": "nausea",
-            "ikọ pupo": "severe vomiting",
-            "ikọ n wa le": "severe vomiting",
+            ("ìtọ", "diarrhea"),
+            ("ìtọ to gaju", "severe diarrhea"),
+            ("ìtọ to gaju pupo", "very severe diarrhea"),
+            ("ìtọ to ni eje", "bloody diarrhea"),
+            ("ìtọ n wa", "diarrhea"),
+            ("ìtọ n wa gidigidi", "severe diarrhea"),
+            ("ìtọ pupo", "severe diarrhea"),
+            ("ìtọ n wa le", "severe diarrhea"),
             
             # Weakness & Fatigue - Enhanced
-            "alailera": "weakness",
-            "alailera to gaju": "severe weakness",
-            "alailera to gaju pupo": "very severe weakness",
-            "alailera pupo": "severe weakness",
-            "alailera n wa": "weakness",
-            "alailera n wa gidigidi": "severe weakness",
-            "alailera n wa le": "severe weakness",
-            
-            "agbara n dinku": "weakness",
-            "agbara n dinku to gaju": "severe weakness",
-            "agbara n dinku pupo": "severe weakness",
-            "agbara n wa": "weakness",
-            "agbara n wa gidigidi": "severe weakness",
-            "agbara n wa le": "severe weakness",
+            ("alailera", "weakness"),
+            ("alailera to gaju", "severe weakness"),
+            ("alailera to gaju pupo", "very severe weakness"),
+            ("alailera pupo", "severe weakness"),
+            ("alailera n wa", "weakness"),
+            ("alailera n wa gidigidi", "severe weakness"),
+            ("alailera n wa le", "severe weakness"),
+            
+            ("agbara n dinku", "weakness"),
+            ("agbara n dinku to gaju", "severe weakness"),
+            ("agbara n dinku pupo", "severe weakness"),
+            ("agbara n wa", "weakness"),
+            ("agbara n wa gidigidi", "severe weakness"),
+            ("agbara n wa le", "severe weakness"),
             
             # Breathing problems - Enhanced
-            "ipalara emi": "difficulty breathing",
-            "ipalara emi to gaju": "severe breathing difficulty",
-            "ipalara emi pupo": "severe breathing difficulty",
-            "emi n le": "difficulty breathing",
-            "emi n le to gaju": "severe breathing difficulty",
-            "emi n le pupo": "severe breathing difficulty",
-            "emi n le gidigidi": "severe breathing difficulty",
-            "emi n yara": "fast breathing",
-            "emi n yara to gaju": "very fast breathing",
-            "emi n yara pupo": "very fast breathing",
-            "emi n le to gaju": "severe breathing difficulty",
+            ("ipalara emi", "difficulty breathing"),
+            ("ipalara emi to gaju", "severe breathing difficulty"),
+            ("ipalara emi pupo", "severe breathing difficulty"),
+            ("emi n le", "difficulty breathing"),
+            ("emi n le to gaju", "severe breathing difficulty"),
+            ("emi n le pupo", "severe breathing difficulty"),
+            ("emi n le gidigidi", "severe breathing difficulty"),
+            ("emi n yara", "fast breathing"),
+            ("emi n yara to gaju", "very fast breathing"),
+            ("emi n yara pupo", "very fast breathing"),
             
             # Cough - Enhanced
-            "ikọ": "cough",
-            "ikọ to gaju": "persistent cough",
-            "ikọ to gaju pupo": "very severe cough",
-            "ikọ to ni eje": "coughing blood",
-            "ikọ n wa": "dry cough",
-            "ikọ n wa gidigidi": "severe cough",
-            "ikọ pupo": "severe cough",
-            "ikọ n wa le": "severe cough",
+            ("ikọ", "cough"),
+            ("ikọ to gaju", "persistent cough"),
+            ("ikọ to gaju pupo", "very severe cough"),
+            ("ikọ to ni eje", "coughing blood"),
+            ("ikọ n wa", "dry cough"),
+            ("ikọ n wa gidigidi", "severe cough"),
+            ("ikọ pupo", "severe cough"),
+            ("ikọ n wa le", "severe cough"),
             
             # Loss of consciousness & Seizures - Enhanced
-            "ailera": "unconscious",
-            "ailera to gaju": "severe unconsciousness",
-            "ailera to gaju pupo": "very severe unconsciousness",
-            "ailera pupo": "severe unconsciousness",
-            "ailera n wa": "unconscious",
-            "ailera n wa gidigidi": "severe unconsciousness",
-            "ailera n wa le": "severe unconsciousness",
-            
-            "gbigbe": "convulsions",
-            "gbigbe to gaju": "severe convulsions",
-            "gbigbe to gaju pupo": "very severe convulsions",
-            "gbigbe pupo": "severe convulsions",
-            "gbigbe n wa": "convulsions",
-            "gbigbe n wa gidigidi": "severe convulsions",
-            "gbigbe n wa le": "severe convulsions",
+            ("ailera", "unconscious"),
+            ("ailera to gaju", "severe unconsciousness"),
+            ("ailera to gaju pupo", "very severe unconsciousness"),
+            ("ailera pupo", "severe unconsciousness"),
+            ("ailera n wa", "unconscious"),
+            ("ailera n wa gidigidi", "severe unconsciousness"),
+            ("ailera n wa le", "severe unconsciousness"),
+            
+            ("gbigbe", "convulsions"),
+            ("gbigbe to gaju", "severe convulsions"),
+            ("gbigbe to gaju pupo", "very severe convulsions"),
+            ("gbigbe pupo", "severe convulsions"),
+            ("gbigbe n wa", "convulsions"),
+            ("gbigbe n wa gidigidi", "severe convulsions"),
+            ("gbigbe n wa le", "severe convulsions"),
             
             # Dehydration - Enhanced
-            "ailera omi": "dehydration",
-            "ailera omi to gaju": "severe dehydration",
-            "ailera omi to gaju pupo": "very severe dehydration",
-            "ailera omi pupo": "severe dehydration",
-            "enu n gbe": "dry mouth",
-            "enu n gbe gidigidi": "dry mouth",
-            "enu n gbe to gaju": "very dry mouth",
-            "enu n gbe pupo": "very dry mouth",
-            "ailera isin": "reduced urination",
-            "ailera isin to gaju": "severely reduced urination",
-            "ailera isin pupo": "severely reduced urination",
-            "isin n dinku": "reduced urination",
-            "isin n dinku to gaju": "severely reduced urination",
-            "isin n dinku pupo": "severely reduced urination",
+            ("ailera omi", "dehydration"),
+            ("ailera omi to gaju", "severe dehydration"),
+            ("ailera omi to gaju pupo", "very severe dehydration"),
+            ("ailera omi pupo", "severe dehydration"),
+            ("enu n gbe", "dry mouth"),
+            ("enu n gbe gidigidi", "dry mouth"),
+            ("enu n gbe to gaju", "very dry mouth"),
+            ("enu n gbe pupo", "very dry mouth"),
+            ("ailera isin", "reduced urination"),
+            ("ailera isin to gaju", "severely reduced urination"),
+            ("ailera isin pupo", "severely reduced urination"),
+            ("isin n dinku", "reduced urination"),
+            ("isin n dinku to gaju", "severely reduced urination"),
+            ("isin n dinku pupo", "severely reduced urination"),
             
             # Bleeding - Enhanced
-            "eje n ja": "bleeding",
-            "eje n ja to gaju": "severe bleeding",
-            "eje n ja to gaju pupo": "very severe bleeding",
-            "eje n ja pupo": "severe bleeding",
-            "eje lati inu imu": "nosebleed",
-            "imu n ja eje": "nosebleed",
-            "eje n ja le": "severe bleeding",
+            ("eje n ja", "bleeding"),
+            ("eje n ja to gaju", "severe bleeding"),
+            ("eje n ja to gaju pupo", "very severe bleeding"),
+            ("eje n ja pupo", "severe bleeding"),
+            ("eje lati inu imu", "nosebleed"),
+            ("imu n ja eje", "nosebleed"),
+            ("eje n ja le", "severe bleeding"),
             
             # Skin conditions - Enhanced
-            "ara n ka": "itching",
-            "ara n ka gidigidi": "itching",
-            "ara n ka to gaju": "severe itching",
-            "ara n ka pupo": "severe itching",
-            "ara n yi": "rash",
-            "ara n yi to gaju": "severe rash",
-            "ara n yi pupo": "severe rash",
-            "ara n bo": "skin peeling",
-            "ara n bo to gaju": "severe skin peeling",
-            "ara n bo pupo": "severe skin peeling",
-            "ara n dun": "skin abscess",
-            "ara n dun gidigidi": "skin abscess",
-            "ara n dun to gaju": "severe skin abscess",
-            "ara n dun pupo": "severe skin abscess",
+            ("ara n ka", "itching"),
+            ("ara n ka gidigidi", "itching"),
+            ("ara n ka to gaju", "severe itching"),
+            ("ara n ka pupo", "severe itching"),
+            ("ara n yi", "rash"),
+            ("ara n yi to gaju", "severe rash"),
+            ("ara n yi pupo", "severe rash"),
+            ("ara n bo", "skin peeling"),
+            ("ara n bo to gaju", "severe skin peeling"),
+            ("ara n bo pupo", "severe skin peeling"),
             
             # Pregnancy related - Enhanced
-            "oyun": "pregnant",
-            "obinrin n oyun": "pregnant",
-            "oyun to gaju": "pregnancy complications",
-            "oyun to gaju pupo": "severe pregnancy complications",
-            "oyun pupo": "pregnancy complications",
-            "oyun n wa": "pregnant",
-            "oyun n wa le": "pregnancy complications",
+            ("oyun", "pregnant"),
+            ("obinrin n oyun", "pregnant"),
+            ("oyun to gaju", "pregnancy complications"),
+            ("oyun to gaju pupo", "severe pregnancy complications"),
+            ("oyun pupo", "pregnancy complications"),
+            ("oyun n wa", "pregnant"),
+            ("oyun n wa le", "pregnancy complications"),
             
             # General descriptions - Enhanced
-            "to gaju": "severe",
-            "to gaju pupo": "very severe",
-            "toto": "mild",
-            "pupo": "many",
-            "pupo pupo": "very many",
-            "pataki": "serious",
-            "le": "severe",
-            "n pọ": "worsening",
-            "n wa": "is",
-            "n wa le": "is severe",
-            "lati": "for",
-            "nipa": "about",
+            ("to gaju", "severe"),
+            ("to gaju pupo", "very severe"),
+            ("toto", "mild"),
+            ("pupo", "many"),
+            ("pupo pupo", "very many"),
+            ("pataki", "serious"),
+            ("le", "severe"),
+            ("n pọ", "worsening"),
+            ("n wa", "is"),
+            ("n wa le", "is severe"),
+            ("lati", "for"),
+            ("nipa", "about"),
             
             # Time descriptions - Enhanced
-            "ana": "1 day",
-            "oni": "less than 1 day",
-            "ose ti koja": "7 days",
-            "ojo die": "few days",
-            "ojo pupo": "many days",
-            "bayi": "recently",
-            "koja": "past",
-            "die": "few",
-            "pupo": "many"
-        }
+            ("ana", "1 day"),
+            ("oni", "less than 1 day"),
+            ("ose ti koja", "7 days"),
+            ("ojo die", "few days"),
+            ("ojo pupo", "many days"),
+            ("bayi", "recently"),
+            ("koja", "past"),
+            ("die", "few")
+        ])
     
     def detect_language(self, text: str) -> Optional[str]:
         """
@@ -719,83 +809,150 @@ class EnhancedMultilingualTranslator:
         if not text:
             return None
         
-        text_lower = text.lower()
+        # Composed and casefolded once, so tone marks typed as combining
+        # characters still hit the precomposed keywords ('ikọ', 'ìtọ')
+        return self._detect_folded(fold(text))
+    
+    def _detect_folded(self, text_lower: str) -> Optional[str]:
+        """detect_language on text already in fold() form"""
+        if self._keyword_automaton is not None:
+            return self._detect_with_automaton(text_lower)
         
-        # Count matches for each language
-        language_scores = {}
+        # Count matches for each language; context keywords (Igbo and
+        # Yoruba) carry a lower weight
+        scores = 0
+        token_weights = self._token_weights
+        pair_weights = self._pair_weights
+        prev_token, prev_end = None, 0
+        for match in _WORD_RE.finditer(text_lower):
+            token = match.group()
+            scores += token_weights.get(token, 0)
+            
+            # Two tokens form a keyword only when joined by exactly one
+            # hyphen or by whitespace, as r'\bna-egbu\b' / r'\bn\s+dun\b' require
+            if prev_token is not None:
+                gap = text_lower[prev_end:match.start()]
+                if gap == '-':
+                    scores += pair_weights.get(prev_token + '-' + token, 0)
+                elif gap.isspace():
+                    scores += pair_weights.get(prev_token + ' ' + token, 0)
+            prev_token, prev_end = token, match.end()
         
-        for lang, patterns in self.language_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text_lower))
-                score += matches
-            
-            # Add context pattern bonus for Igbo and Yoruba
-            if lang in self.context_patterns:
-                for pattern in self.context_patterns[lang]:
-                    matches = len(re.findall(pattern, text_lower))
-                    score += matches * 0.5  # Lower weight for context patterns
-            
-            language_scores[lang] = score
+        return self._best_language(scores)
+    
+    def _detect_with_automaton(self, text_lower: str) -> Optional[str]:
+        r"""
+        Single-pass keyword scoring with the Aho-Corasick automaton
         
-        # Return language with highest score
-        if language_scores:
-            best_lang = max(language_scores, key=language_scores.get)
-            if language_scores[best_lang] > 0:
-                return best_lang
+        Hits not bounded by non-word characters on both sides are skipped,
+        matching the r'\b...\b' patterns used by the regex path.
+        """
+        text_norm = ' '.join(text_lower.split())
+        scores = 0
+        for _, increment in self._automaton_hits(text_norm):
+            scores += increment
+        return self._best_language(scores)
+    
+    def _automaton_hits(self, text_norm: str):
+        """(start, packed score increment) for each word-bounded keyword hit"""
+        last = len(text_norm) - 1
+        for end, (length, increment) in self._keyword_automaton.iter(text_norm):
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_norm[start - 1]):
+                continue
+            if end < last and _is_word_char(text_norm[end + 1]):
+                continue
+            yield start, increment
+    
+    def detect_languages(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Detect the language of several texts with one automaton pass
         
-        return None
+        Gives the same result as calling detect_language on each text; the
+        texts are joined, scanned once, and each hit is attributed back to
+        its text by offset.
+        """
+        return self._detect_folded_batch([fold(text) if text else '' for text in texts])
+    
+    def _detect_folded_batch(self, texts_lower: List[str]) -> List[Optional[str]]:
+        """detect_languages on texts already in fold() form"""
+        if self._keyword_automaton is None or len(texts_lower) < 2:
+            return [self._detect_folded(text_lower) for text_lower in texts_lower]
+        
+        # Whitespace runs are collapsed per text, as in _detect_with_automaton
+        normalized = [' '.join(text_lower.split()) for text_lower in texts_lower]
+        starts = list(accumulate((len(text) + 1 for text in normalized[:-1]), initial=0))
+        
+        scores = [0] * len(texts_lower)
+        for start, increment in self._automaton_hits(_BATCH_SEPARATOR.join(normalized)):
+            scores[bisect_right(starts, start) - 1] += increment
+        return [self._best_language(text_scores) for text_scores in scores]
+    
+    def _best_language(self, scores: int) -> Optional[str]:
+        """
+        Unpack per-language lanes and return the highest-scoring language
+        
+        Ties go to the earlier language; None if nothing scored.
+        """
+        best_lang, best_score = None, 0
+        for lang in self.language_patterns:
+            score = scores & _LANE_MASK
+            if score > best_score:
+                best_lang, best_score = lang, score
+            scores >>= _LANE_BITS
+        return best_lang
     
     def translate_symptoms(self, symptoms: List[str]) -> Tuple[List[str], Dict[str, str]]:
         """
         Enhanced translation with improved accuracy
         """
-        translated_symptoms = []
+        # Each symptom is folded once; detection and phrase matching both
+        # work on that copy
+        symptoms_lower = [fold(symptom) if symptom else '' for symptom in symptoms]
+        
+        # Symptoms with no detected language need no translation (already
+        # English), so the output starts as a copy and only translated
+        # entries are overwritten
+        translated_symptoms = list(symptoms)
         translation_map = {}
         
-        for symptom in symptoms:
-            # Detect language
-            detected_lang = self.detect_language(symptom)
-            
-            if detected_lang and detected_lang in self.languages:
+        # Detect every symptom's language in one batch pass
+        detected = self._detect_folded_batch(symptoms_lower)
+        for index, detected_lang in enumerate(detected):
+            if detected_lang in self.languages:
                 # Translate using detected language
-                translated, changes = self._translate_with_language(symptom, detected_lang)
-                translated_symptoms.append(translated)
+                symptom = symptoms[index]
+                translated, changes = self._translate_with_language(
+                    symptom, detected_lang, symptoms_lower[index]
+                )
+                translated_symptoms[index] = translated
                 
                 if changes:
                     translation_map[symptom] = translated
-            else:
-                # No translation needed (already English)
-                translated_symptoms.append(symptom)
         
         return translated_symptoms, translation_map
     
-    def _translate_with_language(self, text: str, language: str) -> Tuple[str, List[str]]:
+    def _translate_with_language(self, text: str, language: str,
+                                 text_lower: Optional[str] = None) -> Tuple[str, List[str]]:
         """
         Enhanced translation with better phrase matching
+        
+        text_lower, if given, must be fold(text).
         """
         if language not in self.languages:
             return text, []
         
-        mappings = self.languages[language]
-        original_text = text
-        text_lower = text.lower()
-        translations_made = []
-        
-        # Sort phrases by length (longest first) to handle multi-word phrases
-        sorted_phrases = sorted(mappings.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        # Replace each phrase
-        for phrase, english in sorted_phrases:
-            if phrase in text_lower:
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-                if pattern.search(text_lower):
-                    text = pattern.sub(english, text, count=1)
-                    text_lower = text.lower()
-                    translations_made.append(f"'{phrase}' → '{english}'")
-        
-        return text, translations_made
+        translated, translations_made = self._translate_cached(text, language, text_lower)
+        # A copy, so callers cannot mutate the cached result
+        return translated, list(translations_made)
+    
+    def _translate_uncached(self, text: str, language: str,
+                            text_lower: Optional[str] = None) -> Tuple[str, Tuple[str, ...]]:
+        """Uncached body of _translate_with_language, returning an immutable list of changes"""
+        # Longest phrase wins at each position, so multi-word phrases are
+        # matched before the single words inside them
+        translated, translations_made = self._matchers[language].translate(text, text_lower)
+        return translated, tuple(translations_made)
     
     def get_translation_summary(self, translation_map: Dict[str, str]) -> str:
         """
@@ -804,9 +961,10 @@ class EnhancedMultilingualTranslator:
         if not translation_map:
             return "No translations needed (standard English)"
         
-        summary = "Translated from Nigerian languages:\n"
-        for original, translated in translation_map.items():
-            summary += f"  • '{original}' → '{translated}'\n"
+        summary = "Translated from Nigerian languages:\n" + "".join(
+            f"  • '{original}' → '{translated}'\n"
+            for original, translated in translation_map.items()
+        )
         
         return summary.strip()
 
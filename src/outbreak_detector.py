@@ -3,65 +3,273 @@ MediLink PHC - Outbreak Detection System
 Uses statistical Z-score method to detect disease outbreaks
 """
 
+import math
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import json
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Union
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below still run as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Histories longer than this go through the compiled kernel; shorter ones
+# are handled in plain Python, where NumPy's per-call overhead dominates
+JIT_MIN_HISTORY = 20
+
+
+@njit(cache=True, fastmath=True)
+def _zscore_stats(current, hist):
+    """
+    Mean, sample std, Z-score and multiplier of current vs hist in one kernel
+    
+    A zero std is replaced with 1.0, matching detect_outbreak.
+    """
+    n = hist.shape[0]
+    s = 0.0
+    for i in range(n):
+        s += hist[i]
+    mean = s / n
+    v = 0.0
+    for i in range(n):
+        d = hist[i] - mean
+        v += d * d
+    std = (v / (n - 1)) ** 0.5 if n > 1 else 0.0
+    if std == 0:
+        std = 1.0
+    z = (current - mean) / std
+    mult = current / mean if mean > 0 else 0.0
+    return mean, std, z, mult
+
+
+def _percentile_of_sorted(ordered, q):
+    """
+    Linear-interpolated percentile (q in [0, 1]) of a sorted sequence
+    
+    Same index and interpolation arithmetic as np.percentile's default
+    method, so the IQR bounds agree exactly.
+    """
+    n = len(ordered)
+    index = (n - 1) * q
+    lo = int(index)  # index >= 0, so truncation is floor
+    hi = min(lo + 1, n - 1)
+    t = index - lo
+    a = ordered[lo]
+    b = ordered[hi]
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
+
+
+_percentile_of_sorted_jit = njit(cache=True)(_percentile_of_sorted)
+
+
+@njit(cache=True)
+def _clean_history(hist):
+    """
+    Zero and IQR-outlier removal in one kernel, as _clean_historical_data
+    
+    Kept values stay in their original order.
+    """
+    positive = np.empty(hist.shape[0])
+    n = 0
+    for i in range(hist.shape[0]):
+        if hist[i] > 0:
+            positive[n] = hist[i]
+            n += 1
+    if n == 0:
+        return positive[:0]
+    
+    ordered = np.sort(positive[:n])
+    q1 = _percentile_of_sorted_jit(ordered, 0.25)
+    q3 = _percentile_of_sorted_jit(ordered, 0.75)
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
+    
+    clean = np.empty(n)
+    m = 0
+    for i in range(n):
+        if positive[i] >= lower and positive[i] <= upper:
+            clean[m] = positive[i]
+            m += 1
+    return clean[:m]
+
+
+def _clean_short_history(historical_cases: List[int]) -> List[int]:
+    """Plain-Python _clean_historical_data for short histories"""
+    positive = [cases for cases in historical_cases if cases > 0]
+    if not positive:
+        return []
+    
+    ordered = sorted(positive)
+    q1 = _percentile_of_sorted(ordered, 0.25)
+    q3 = _percentile_of_sorted(ordered, 0.75)
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
+    return [cases for cases in positive if lower <= cases <= upper]
+
+
+def _mean_std(values: List[int]) -> Tuple[float, float]:
+    """Mean and sample standard deviation of a short list (len >= 2)"""
+    n = len(values)
+    mean = sum(values) / n
+    squares = 0.0
+    for value in values:
+        deviation = value - mean
+        squares += deviation * deviation
+    return mean, math.sqrt(squares / (n - 1))
+
 
 class OutbreakDetector:
     """
     Detects disease outbreaks using statistical analysis
     """
     
+    # Recommendation text is static, so it is built once per class
+    _SEVERITY_RECOMMENDATIONS: Dict[str, Tuple[str, ...]] = {
+        "severe": (
+            "Immediate notification to health authorities",
+            "Activate emergency response protocols",
+            "Increase surveillance and testing",
+            "Consider isolation/quarantine measures",
+            "Prepare for increased patient load",
+            "Alert nearby healthcare facilities"
+        ),
+        "moderate": (
+            "Increase monitoring frequency",
+            "Prepare additional resources",
+            "Notify health authorities",
+            "Review infection control measures",
+            "Consider targeted interventions"
+        ),
+        "normal": (
+            "Continue routine monitoring",
+            "Maintain standard protocols",
+            "Document case patterns"
+        )
+    }
+    
+    _DISEASE_RECOMMENDATIONS: Dict[str, Tuple[str, ...]] = {
+        "malaria": (
+            "Distribute mosquito nets and repellents",
+            "Increase vector control measures"
+        ),
+        "cholera": (
+            "Ensure clean water supply",
+            "Promote hand hygiene"
+        ),
+        "meningitis": (
+            "Consider mass vaccination if available",
+            "Implement respiratory precautions"
+        )
+    }
+    
     def __init__(self):
         self.outbreak_threshold = 2.0  # Z-score threshold for outbreak
         self.severe_threshold = 3.0    # Z-score threshold for severe outbreak
         
     def detect_outbreak(self, disease_name: str, current_cases: int, 
-                       historical_cases: List[int], 
-                       time_period: str = "weekly") -> Dict:
+                       historical_cases: Union[np.ndarray, List[int]], 
+                       time_period: str = "weekly",
+                       timestamp: Optional[str] = None) -> Dict:
         """
         Detect outbreak using Z-score method
         
         Args:
             disease_name: Name of the disease (e.g., "Malaria")
             current_cases: Current period case count
-            historical_cases: List of historical case counts
+            historical_cases: Historical case counts, preferably as an integer
+                ndarray (plain lists are converted on entry)
             time_period: "daily", "weekly", or "monthly"
+            timestamp: ISO timestamp to stamp the response with (defaults
+                to now); lets a batch of analyses share one clock reading
         
         Returns:
             Dictionary with outbreak analysis
         """
         
         # Validate inputs
-        if not historical_cases or len(historical_cases) < 3:
-            return self._create_no_data_response(disease_name, current_cases)
-        
-        # Remove zeros and outliers for better statistics
-        clean_historical = self._clean_historical_data(historical_cases)
-        
-        if len(clean_historical) < 3:
-            return self._create_no_data_response(disease_name, current_cases)
-        
-        # Calculate statistics
-        mean_cases = np.mean(clean_historical)
-        std_cases = np.std(clean_historical, ddof=1)  # Sample standard deviation
-        
-        # Handle edge case where std is 0
-        if std_cases == 0:
-            std_cases = 1.0
-        
-        # Calculate Z-score
-        z_score = (current_cases - mean_cases) / std_cases
+        if historical_cases is None or len(historical_cases) < 3:
+            return self._create_no_data_response(disease_name, current_cases, timestamp)
+        
+        if len(historical_cases) <= JIT_MIN_HISTORY:
+            # Short histories: sorting and summing a few ints in Python beats
+            # the setup cost of each NumPy call
+            if isinstance(historical_cases, np.ndarray):
+                historical_cases = historical_cases.tolist()
+            clean_historical = _clean_short_history(historical_cases)
+            
+            if len(clean_historical) < 3:
+                return self._create_no_data_response(disease_name, current_cases, timestamp)
+            
+            # As np.float64, so the rounding below behaves as on the NumPy path
+            mean_cases, std_cases = map(np.float64, _mean_std(clean_historical))
+            
+            # Handle edge case where std is 0
+            if std_cases == 0:
+                std_cases = 1.0
+            
+            z_score = (current_cases - mean_cases) / std_cases
+            multiplier = current_cases / mean_cases
+        elif NUMBA_AVAILABLE:
+            # Long histories: compiled kernels for the cleaning and for all
+            # statistics, with no intermediate lists
+            clean_historical = _clean_history(np.asarray(historical_cases, dtype=np.float64))
+            
+            if len(clean_historical) < 3:
+                return self._create_no_data_response(disease_name, current_cases, timestamp)
+            
+            # As np.float64, so the rounding below behaves as on the NumPy path
+            mean_cases, std_cases, z_score, multiplier = map(np.float64, _zscore_stats(
+                float(current_cases), clean_historical
+            ))
+        else:
+            # Remove zeros and outliers for better statistics
+            clean_historical = self._clean_historical_data(historical_cases)
+            
+            if len(clean_historical) < 3:
+                return self._create_no_data_response(disease_name, current_cases, timestamp)
+            
+            # Calculate statistics
+            mean_cases = np.mean(clean_historical)
+            std_cases = np.std(clean_historical, ddof=1)  # Sample standard deviation
+            
+            # Handle edge case where std is 0
+            if std_cases == 0:
+                std_cases = 1.0
+            
+            # Calculate Z-score
+            z_score = (current_cases - mean_cases) / std_cases
+            
+            # Calculate multiplier
+            multiplier = current_cases / mean_cases if mean_cases > 0 else 0
         
+        return self._create_outbreak_response(
+            disease_name, current_cases, mean_cases, std_cases, z_score, multiplier,
+            time_period, timestamp
+        )
+    
+    def _create_outbreak_response(self, disease_name: str, current_cases: int,
+                                  mean_cases: float, std_cases: float, z_score: float,
+                                  multiplier: float, time_period: str,
+                                  timestamp: Optional[str] = None) -> Dict:
+        """
+        Classify the Z-score and assemble the outbreak analysis response
+        """
         # Determine outbreak status
         is_outbreak = z_score >= self.outbreak_threshold
         is_severe = z_score >= self.severe_threshold
         
-        # Calculate multiplier
-        multiplier = current_cases / mean_cases if mean_cases > 0 else 0
-        
         # Generate alert message
         alert_message = self._generate_alert_message(
             disease_name, current_cases, mean_cases, multiplier, z_score, is_severe
@@ -88,17 +296,17 @@ class OutbreakDetector:
             "multiplier": round(multiplier, 1),
             "alert_message": alert_message,
             "recommendations": self._get_recommendations(severity, disease_name),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or datetime.now().isoformat()
         }
         
         return response
     
-    def _clean_historical_data(self, historical_cases: List[int]) -> List[int]:
+    def _clean_historical_data(self, historical_cases: Union[np.ndarray, List[int]]) -> List[int]:
         """
         Clean historical data by removing outliers and zeros
         """
-        # Convert to numpy array for easier manipulation
-        data = np.array(historical_cases)
+        # No copy when the caller already passed an ndarray
+        data = np.asarray(historical_cases)
         
         # Remove zeros (might indicate missing data)
         data = data[data > 0]
@@ -120,7 +328,54 @@ class OutbreakDetector:
         
         return clean_data.tolist()
     
-    def _create_no_data_response(self, disease_name: str, current_cases: int) -> Dict:
+    def _batch_statistics(self, current_cases: List[int],
+                          histories: List[Union[np.ndarray, List[int]]]) -> List[Optional[tuple]]:
+        """
+        Mean, std, Z-score and multiplier for several diseases at once
+        
+        Applies the same cleaning and formulas as detect_outbreak row-wise to
+        a NaN-padded matrix (one row per disease). Entries are None where too
+        little history survives cleaning.
+        """
+        if not histories:
+            return []
+        
+        data = np.full((len(histories), max(len(h) for h in histories)), np.nan)
+        for row, historical_cases in zip(data, histories):
+            row[:len(historical_cases)] = historical_cases
+        
+        # Remove zeros (might indicate missing data)
+        data[data <= 0] = np.nan
+        results = [None] * len(histories)
+        rows = np.flatnonzero(np.count_nonzero(~np.isnan(data), axis=1) >= 3)
+        if len(rows) == 0:
+            return results
+        data = data[rows]
+        
+        # Remove extreme outliers using IQR method
+        Q1, Q3 = np.nanpercentile(data, [25, 75], axis=1, keepdims=True)
+        IQR = Q3 - Q1
+        data[(data < Q1 - 1.5 * IQR) | (data > Q3 + 1.5 * IQR)] = np.nan
+        
+        enough = np.count_nonzero(~np.isnan(data), axis=1) >= 3
+        rows, data = rows[enough], data[enough]
+        if len(rows) == 0:
+            return results
+        
+        current = np.asarray(current_cases, dtype=np.float64)[rows]
+        means = np.nanmean(data, axis=1)
+        stds = np.nanstd(data, axis=1, ddof=1)
+        stds[stds == 0] = 1.0
+        z_scores = (current - means) / stds
+        # Cleaned histories are all positive, so every mean is too
+        multipliers = current / means
+        
+        for i, row in enumerate(rows):
+            results[row] = (means[i], stds[i], z_scores[i], multipliers[i])
+        return results
+    
+    def _create_no_data_response(self, disease_name: str, current_cases: int,
+                                 timestamp: Optional[str] = None) -> Dict:
         """
         Create response when insufficient historical data
         """
@@ -135,7 +390,7 @@ class OutbreakDetector:
             "multiplier": 0,
             "alert_message": f"Insufficient historical data for {disease_name} outbreak detection",
             "recommendations": ["Collect more historical data", "Monitor closely"],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "error": "insufficient_data"
         }
     
@@ -156,46 +411,18 @@ class OutbreakDetector:
         """
         Get recommendations based on outbreak severity
         """
-        recommendations = []
-        
-        if severity == "severe":
-            recommendations.extend([
-                "Immediate notification to health authorities",
-                "Activate emergency response protocols",
-                "Increase surveillance and testing",
-                "Consider isolation/quarantine measures",
-                "Prepare for increased patient load",
-                "Alert nearby healthcare facilities"
-            ])
-        elif severity == "moderate":
-            recommendations.extend([
-                "Increase monitoring frequency",
-                "Prepare additional resources",
-                "Notify health authorities",
-                "Review infection control measures",
-                "Consider targeted interventions"
-            ])
-        else:
-            recommendations.extend([
-                "Continue routine monitoring",
-                "Maintain standard protocols",
-                "Document case patterns"
-            ])
+        recommendations = self._SEVERITY_RECOMMENDATIONS.get(
+            severity, self._SEVERITY_RECOMMENDATIONS["normal"]
+        )
         
         # Add disease-specific recommendations
-        if disease_name.lower() == "malaria":
-            recommendations.append("Distribute mosquito nets and repellents")
-            recommendations.append("Increase vector control measures")
-        elif disease_name.lower() == "cholera":
-            recommendations.append("Ensure clean water supply")
-            recommendations.append("Promote hand hygiene")
-        elif disease_name.lower() == "meningitis":
-            recommendations.append("Consider mass vaccination if available")
-            recommendations.append("Implement respiratory precautions")
-        
-        return recommendations
+        extra = self._DISEASE_RECOMMENDATIONS.get(disease_name.lower(), ())
+        
+        # A fresh list per response, so callers may modify it
+        return [*recommendations, *extra]
     
-    def analyze_multiple_diseases(self, disease_data: Dict[str, Dict]) -> Dict:
+    def analyze_multiple_diseases(self, disease_data: Dict[str, Dict],
+                                  timestamp: Optional[str] = None) -> Dict:
         """
         Analyze multiple diseases for outbreaks
         
@@ -205,6 +432,7 @@ class OutbreakDetector:
                     "Malaria": {"current": 45, "historical": [20, 22, 18, 25, 21]},
                     "Typhoid": {"current": 12, "historical": [8, 10, 9, 11, 7]}
                 }
+            timestamp: ISO timestamp to stamp the batch with (defaults to now)
         
         Returns:
             Dictionary with analysis for all diseases
@@ -213,11 +441,33 @@ class OutbreakDetector:
         outbreak_count = 0
         severe_outbreak_count = 0
         
+        # One clock reading for the whole batch and its summary
+        timestamp = timestamp or datetime.now().isoformat()
+        
+        # Statistics for every disease with enough history are computed in
+        # one pass over a stacked matrix instead of per detect_outbreak call
+        batch = {}
         for disease, data in disease_data.items():
-            current_cases = data.get("current", 0)
             historical_cases = data.get("historical", [])
+            if historical_cases is not None and len(historical_cases) >= 3:
+                batch[disease] = historical_cases
+        stats = self._batch_statistics(
+            [disease_data[disease].get("current", 0) for disease in batch],
+            list(batch.values())
+        )
+        stats_by_disease = dict(zip(batch, stats))
+        
+        for disease, data in disease_data.items():
+            current_cases = data.get("current", 0)
+            disease_stats = stats_by_disease.get(disease)
             
-            analysis = self.detect_outbreak(disease, current_cases, historical_cases)
+            if disease_stats is None:
+                analysis = self._create_no_data_response(disease, current_cases, timestamp)
+            else:
+                analysis = self._create_outbreak_response(
+                    disease, current_cases, *disease_stats, time_period="weekly",
+                    timestamp=timestamp
+                )
             results[disease] = analysis
             
             if analysis["is_outbreak"]:
@@ -232,7 +482,7 @@ class OutbreakDetector:
             "severe_outbreaks": severe_outbreak_count,
             "overall_status": "CRITICAL" if severe_outbreak_count > 0 else 
                             "ALERT" if outbreak_count > 0 else "NORMAL",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         return {
@@ -247,7 +497,9 @@ class OutbreakDetector:
         summary = analysis_results["summary"]
         diseases = analysis_results["disease_analyses"]
         
-        report = f"""
+        # Fragments are collected and joined once, rather than growing one
+        # string per disease and recommendation
+        parts = [f"""
 🏥 MEDILINK PHC - OUTBREAK DETECTION REPORT
 {'='*60}
 Generated: {summary['timestamp']}
@@ -259,12 +511,12 @@ Severe Outbreaks: {summary['severe_outbreaks']}
 
 DETAILED ANALYSIS:
 {'-'*40}
-"""
+"""]
         
         for disease, analysis in diseases.items():
             status_icon = "🚨" if analysis["severity"] == "severe" else "⚠️" if analysis["is_outbreak"] else "✅"
             
-            report += f"""
+            parts.append(f"""
 {status_icon} {disease.upper()}
    Current Cases: {analysis['current_cases']}
    Historical Average: {analysis['historical_average']}
@@ -273,11 +525,11 @@ DETAILED ANALYSIS:
    Alert: {analysis['alert_message']}
    
    Recommendations:
-"""
-            for rec in analysis['recommendations'][:3]:  # Show top 3 recommendations
-                report += f"   • {rec}\n"
+""")
+            # Show top 3 recommendations
+            parts.extend(f"   • {rec}\n" for rec in analysis['recommendations'][:3])
         
-        return report
+        return "".join(parts)
 
 
 def test_outbreak_detector():
@@ -0,0 +1,191 @@
+"""
+MediLink PHC - Phrase Matching
+Leftmost-longest dictionary matching shared by the translators
+"""
+
+import re
+import sys
+import unicodedata
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+def fold(text: str) -> str:
+    """
+    Canonical matching form: NFC-composed, then casefolded
+    
+    Yoruba tone marks may arrive decomposed (base letter + combining mark);
+    composing first lets them match the precomposed mapping keys.
+    """
+    return unicodedata.normalize('NFC', text).casefold()
+
+def build_mapping(language: str, pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Build a phrase -> English mapping, rejecting repeated phrases
+    
+    A dict literal silently keeps only the last value for a repeated key,
+    so mappings are written as pairs and collisions fail loudly instead.
+    Phrases and translations are interned: folding builds fresh strings,
+    and the same English terms ("fever", "headache") recur across every
+    language's table and every translator that loads it.
+    """
+    pairs = [(sys.intern(fold(phrase)), sys.intern(english)) for phrase, english in pairs]
+    mapping = dict(pairs)
+    if len(mapping) != len(pairs):
+        counts = Counter(phrase for phrase, _ in pairs)
+        duplicates = sorted(phrase for phrase, count in counts.items() if count > 1)
+        raise ValueError(f"Duplicate {language} phrases: {', '.join(duplicates)}")
+    return mapping
+
+class PhraseTrie:
+    """
+    Character trie of phrases, compiled into a prefix-sharing regex
+    
+    Phrases that share a prefix ("ciwon ...", "ikọ ...") share one branch,
+    so the regex engine reads each prefix once per position instead of once
+    per phrase. Longer continuations are tried before ending at a shorter
+    phrase, which keeps leftmost-longest matching.
+    """
+    
+    _END = ''
+    
+    def __init__(self, phrases):
+        self.root = {}
+        for phrase in phrases:
+            node = self.root
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[self._END] = True
+    
+    def pattern(self) -> str:
+        """Regex source matching the longest phrase at each position"""
+        return self._node_pattern(self.root)
+    
+    def _node_pattern(self, node: dict) -> str:
+        branches = [
+            re.escape(char) + self._node_pattern(child)
+            for char, child in sorted(node.items())
+            if char != self._END
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1:
+            body = branches[0]
+            atomic = len(body) == 1
+        else:
+            body = '(?:' + '|'.join(branches) + ')'
+            atomic = True
+        if self._END in node:
+            # Greedy optional: prefer extending to a longer phrase
+            return (body if atomic else '(?:' + body + ')') + '?'
+        return body
+
+class PhraseMatcher:
+    """
+    Compiled phrase -> English table for one language
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and a
+    trie-shaped regex otherwise; both take the leftmost-longest phrase.
+    Phrases must already be in fold() form.
+    """
+    
+    def __init__(self, mappings: Dict[str, str]):
+        self.mappings = mappings
+        # "'phrase' → 'english'" labels for translations_made, formatted once
+        self.labels = {phrase: f"'{phrase}' → '{english}'" for phrase, english in mappings.items()}
+        
+        self.automaton = None
+        self.regex = None
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for phrase in mappings:
+                self.automaton.add_word(phrase, (len(phrase), phrase))
+            self.automaton.make_automaton()
+        else:
+            self.regex = re.compile(PhraseTrie(mappings).pattern())
+    
+    def spans(self, text_lower: str):
+        """Non-overlapping (start, end, phrase) matches in folded text"""
+        # Most symptoms are a single known phrase ("zazzabi"); a dict hit is
+        # the whole-text leftmost-longest match, with no scan at all
+        if text_lower in self.labels:
+            return ((0, len(text_lower), text_lower),)
+        
+        if self.automaton is None:
+            return ((m.start(), m.end(), m.group()) for m in self.regex.finditer(text_lower))
+        
+        # The automaton reports every phrase ending at every position;
+        # overlaps are resolved leftmost-longest, the same as the regex
+        hits = sorted(
+            ((end - length + 1, end + 1, phrase)
+             for end, (length, phrase) in self.automaton.iter(text_lower)),
+            key=lambda hit: (hit[0], -hit[1])
+        )
+        
+        spans = []
+        pos = 0
+        for start, end, phrase in hits:
+            if start < pos:
+                continue  # overlaps a match already taken
+            spans.append((start, end, phrase))
+            pos = end
+        return spans
+    
+    def has_match(self, text_lower: str) -> bool:
+        """Whether any phrase occurs in folded text (stops at the first hit)"""
+        if self.automaton is None:
+            return self.regex.search(text_lower) is not None
+        return next(self.automaton.iter(text_lower), None) is not None
+    
+    def translate(self, text: str, text_lower: Optional[str] = None) -> Tuple[str, List[str]]:
+        """
+        Replace every matched phrase in text with its English translation
+        
+        Args:
+            text: Input text
+            text_lower: fold(text), if the caller already has it
+        
+        Returns:
+            Tuple of (translated_text, list_of_translations_made)
+        """
+        # Normalise once and match against a casefolded copy; spans are
+        # spliced back into the (composed) text so untranslated words keep
+        # their case
+        text = unicodedata.normalize('NFC', text)
+        if text_lower is None:
+            text_lower = text.casefold()
+        if len(text_lower) != len(text):
+            # Casefolding shifted offsets (e.g. 'İ', 'ß'), so work on the copy
+            text = text_lower
+        
+        mappings = self.mappings
+        labels = self.labels
+        parts = []
+        translations_made = []
+        pos = 0
+        for start, end, phrase in self.spans(text_lower):
+            parts.append(text[pos:start])
+            parts.append(mappings[phrase])
+            pos = end
+            translations_made.append(labels[phrase])
+        parts.append(text[pos:])
+        
+        return ''.join(parts), translations_made
+
+class LazyMatchers(dict):
+    """Builds each language's PhraseMatcher on first use"""
+    
+    def __init__(self, languages: Dict[str, Dict[str, str]]):
+        super().__init__()
+        self._languages = languages
+    
+    def __missing__(self, language: str) -> PhraseMatcher:
+        # Racing threads build identical matchers, so last write wins harmlessly
+        matcher = self[language] = PhraseMatcher(self._languages[language])
+        return matcher
+
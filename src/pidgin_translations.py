@@ -4,126 +4,133 @@ Translates Nigerian Pidgin medical phrases to Standard English
 """
 
 import re
+from functools import cache, lru_cache
 from typing import List, Dict, Tuple
 
+from phrase_matching import PhraseMatcher, build_mapping, fold
+
+DETECT_CACHE_SIZE = 4096
+TRANSLATE_CACHE_SIZE = 4096
+
 
 class PidginTranslator:
     """Translates Nigerian Pidgin to English for medical triage"""
     
-    # Comprehensive Pidgin to English mapping
-    PIDGIN_TO_ENGLISH = {
+    # Comprehensive Pidgin to English mapping, written as pairs so a
+    # repeated phrase fails at import instead of silently replacing one
+    PIDGIN_TO_ENGLISH = build_mapping('pidgin', [
         # Fever & Temperature
-        "body dey hot": "fever",
-        "body dey burn": "high fever",
-        "temperature high": "fever",
-        "e dey hot": "fever",
-        "im body hot": "fever",
-        "hot body": "fever",
+        ("body dey hot", "fever"),
+        ("body dey burn", "high fever"),
+        ("temperature high", "fever"),
+        ("e dey hot", "fever"),
+        ("im body hot", "fever"),
+        ("hot body", "fever"),
         
         # Pain symptoms
-        "head dey pain me": "headache",
-        "head dey hammer me": "severe headache",
-        "my head dey burst": "severe headache",
-        "belle dey pain": "stomach pain",
-        "belle dey pain me": "abdominal pain",
-        "stomach dey do me": "stomach pain",
-        "body dey pain": "body aches",
-        "body dey ache": "body pain",
-        "chest dey pain": "chest pain",
-        "back dey pain": "back pain",
-        "throat dey pain": "sore throat",
-        "joint dey pain": "joint pain",
+        ("head dey pain me", "headache"),
+        ("head dey hammer me", "severe headache"),
+        ("my head dey burst", "severe headache"),
+        ("belle dey pain", "stomach pain"),
+        ("belle dey pain me", "abdominal pain"),
+        ("stomach dey do me", "stomach pain"),
+        ("body dey pain", "body aches"),
+        ("body dey ache", "body pain"),
+        ("chest dey pain", "chest pain"),
+        ("back dey pain", "back pain"),
+        ("throat dey pain", "sore throat"),
+        ("joint dey pain", "joint pain"),
         
         # Diarrhea & Vomiting
-        "shit dey run": "diarrhea",
-        "belle dey run": "diarrhea",
-        "shit dey comot": "diarrhea",
-        "running belle": "diarrhea",
-        "purge": "diarrhea",
-        "e dey purge": "diarrhea",
-        "e dey vomit": "vomiting",
-        "im dey throw up": "vomiting",
-        "e wan comot": "nausea",
-        "belle wan comot": "nausea",
+        ("shit dey run", "diarrhea"),
+        ("belle dey run", "diarrhea"),
+        ("shit dey comot", "diarrhea"),
+        ("running belle", "diarrhea"),
+        ("purge", "diarrhea"),
+        ("e dey purge", "diarrhea"),
+        ("e dey vomit", "vomiting"),
+        ("im dey throw up", "vomiting"),
+        ("e wan comot", "nausea"),
+        ("belle wan comot", "nausea"),
         
         # Weakness & Fatigue
-        "body no get power": "weakness",
-        "body weak": "fatigue",
-        "no strength": "weakness",
-        "e no fit stand": "severe weakness",
-        "im body don weak": "fatigue",
-        "no energy": "fatigue",
-        "body don tire": "exhaustion",
+        ("body no get power", "weakness"),
+        ("body weak", "fatigue"),
+        ("no strength", "weakness"),
+        ("e no fit stand", "severe weakness"),
+        ("im body don weak", "fatigue"),
+        ("no energy", "fatigue"),
+        ("body don tire", "exhaustion"),
         
         # Breathing problems
-        "i no fit breathe well": "difficulty breathing",
-        "breath dey hard": "shortness of breath",
-        "chest dey tight": "chest tightness",
-        "e no fit breath": "respiratory distress",
-        "breath dey fast": "fast breathing",
+        ("i no fit breathe well", "difficulty breathing"),
+        ("breath dey hard", "shortness of breath"),
+        ("chest dey tight", "chest tightness"),
+        ("e no fit breath", "respiratory distress"),
+        ("breath dey fast", "fast breathing"),
         
         # Cough
-        "cough dey worry me": "persistent cough",
-        "e dey cough": "coughing",
-        "im dey cough blood": "coughing blood",
-        "dry cough": "dry cough",
+        ("cough dey worry me", "persistent cough"),
+        ("e dey cough", "coughing"),
+        ("im dey cough blood", "coughing blood"),
+        ("dry cough", "dry cough"),
         
         # Loss of consciousness & Seizures
-        "e don faint": "unconscious",
-        "e loss consciousness": "unconscious",
-        "im body dey shake": "convulsions",
-        "e dey shake": "seizures",
-        "fit dey catch am": "seizures",
+        ("e don faint", "unconscious"),
+        ("e loss consciousness", "unconscious"),
+        ("im body dey shake", "convulsions"),
+        ("e dey shake", "seizures"),
+        ("fit dey catch am", "seizures"),
         
         # Dehydration
-        "eye don sink": "sunken eyes",
-        "mouth dry": "dry mouth",
-        "no urine": "reduced urination",
-        "body don dry": "dehydration",
+        ("eye don sink", "sunken eyes"),
+        ("mouth dry", "dry mouth"),
+        ("no urine", "reduced urination"),
+        ("body don dry", "dehydration"),
         
         # Bleeding
-        "blood dey comot": "bleeding",
-        "blood dey run": "bleeding",
-        "im dey shit blood": "bloody stool",
-        "blood dey come from nose": "nosebleed",
+        ("blood dey comot", "bleeding"),
+        ("blood dey run", "bleeding"),
+        ("im dey shit blood", "bloody stool"),
+        ("blood dey come from nose", "nosebleed"),
         
         # Skin conditions
-        "body dey scratch": "itching",
-        "rash dey": "rash",
-        "skin dey peel": "skin peeling",
-        "boil": "skin abscess",
+        ("body dey scratch", "itching"),
+        ("rash dey", "rash"),
+        ("skin dey peel", "skin peeling"),
+        ("boil", "skin abscess"),
         
         # Pregnancy related
-        "belle": "pregnant",
-        "im get belle": "pregnant",
-        "pregnancy": "pregnant",
+        ("belle", "pregnant"),
+        ("im get belle", "pregnant"),
+        ("pregnancy", "pregnant"),
         
         # General descriptions
-        "very bad": "severe",
-        "small small": "mild",
-        "plenty": "many",
-        "no be small": "serious",
-        "e serious": "severe",
-        "e don worse": "worsening",
-        "since": "for",
-        "done reach": "about",
+        ("very bad", "severe"),
+        ("small small", "mild"),
+        ("plenty", "many"),
+        ("no be small", "serious"),
+        ("e serious", "severe"),
+        ("e don worse", "worsening"),
+        ("since", "for"),
+        ("done reach", "about"),
         
         # Time descriptions
-        "yesterday": "1 day",
-        "today": "less than 1 day",
-        "last week": "7 days",
-        "some days": "few days",
-        "long time": "many days",
-        "just now": "recently",
+        ("yesterday", "1 day"),
+        ("today", "less than 1 day"),
+        ("last week", "7 days"),
+        ("some days", "few days"),
+        ("long time", "many days"),
+        ("just now", "recently"),
         
         # Common verbs
-        "dey": "is",
-        "no dey": "not",
-        "e dey": "it is",
-        "im dey": "he/she is",
-        "comot": "out",
-        "enter": "in"
-    }
+        ("dey", "is"),
+        ("no dey", "not"),
+        ("e dey", "it is"),
+        ("im dey", "he/she is"),
+        ("comot", "out"),
+        ("enter", "in")
+    ])
     
     # Common Pidgin patterns to recognize
     PIDGIN_PATTERNS = [
@@ -131,9 +138,24 @@ class PidginTranslator:
         r'\bbelle\b', r'\bwaka\b', r'\bam\b', r'\bim\b'
     ]
     
+    # All patterns in one precompiled alternation, searched once per text
+    _PIDGIN_RE = re.compile('|'.join(PIDGIN_PATTERNS))
+    
     def __init__(self):
         """Initialize translator with mappings"""
         self.mappings = self.PIDGIN_TO_ENGLISH
+        self._matcher = self._build_matcher()
+        
+        # Intake complaints repeat ("body dey hot"), and the translator is
+        # read-only after construction, so results are cached per instance
+        self.is_pidgin = lru_cache(maxsize=DETECT_CACHE_SIZE)(self.is_pidgin)
+        self._translate_cached = lru_cache(maxsize=TRANSLATE_CACHE_SIZE)(self._translate_uncached)
+    
+    @classmethod
+    @cache
+    def _build_matcher(cls) -> PhraseMatcher:
+        """Compile the phrase table once per process, shared by all instances"""
+        return PhraseMatcher(cls.PIDGIN_TO_ENGLISH)
     
     def is_pidgin(self, text: str) -> bool:
         """
@@ -145,19 +167,14 @@ class PidginTranslator:
         Returns:
             True if Pidgin detected, False otherwise
         """
-        text_lower = text.lower()
+        text_lower = fold(text)
         
         # Check for common Pidgin patterns
-        for pattern in self.PIDGIN_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
+        if self._PIDGIN_RE.search(text_lower):
+            return True
         
-        # Check for exact phrase matches
-        for pidgin_phrase in self.mappings.keys():
-            if pidgin_phrase in text_lower:
-                return True
-        
-        return False
+        # Check for exact phrase matches (one scan for all phrases)
+        return self._matcher.has_match(text_lower)
     
     def translate(self, text: str) -> Tuple[str, List[str]]:
         """
@@ -172,24 +189,16 @@ class PidginTranslator:
         if not text:
             return text, []
         
-        original_text = text
-        text_lower = text.lower()
-        translations_made = []
-        
-        # Sort phrases by length (longest first) to handle multi-word phrases
-        sorted_phrases = sorted(self.mappings.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        # Replace each Pidgin phrase
-        for pidgin, english in sorted_phrases:
-            if pidgin in text_lower:
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(pidgin), re.IGNORECASE)
-                if pattern.search(text_lower):
-                    text = pattern.sub(english, text, count=1)
-                    text_lower = text.lower()
-                    translations_made.append(f"'{pidgin}' → '{english}'")
-        
-        return text, translations_made
+        translated, translations_made = self._translate_cached(text)
+        # A copy, so callers cannot mutate the cached result
+        return translated, list(translations_made)
+    
+    def _translate_uncached(self, text: str) -> Tuple[str, Tuple[str, ...]]:
+        """Uncached body of translate, returning an immutable list of changes"""
+        # One leftmost-longest pass over the text, so multi-word phrases
+        # ("belle dey pain me") win over the shorter phrases inside them
+        translated, translations_made = self._matcher.translate(text)
+        return translated, tuple(translations_made)
     
     def translate_symptoms(self, symptoms: List[str]) -> Tuple[List[str], Dict[str, str]]:
         """
@@ -226,9 +235,10 @@ class PidginTranslator:
         if not translation_map:
             return "No translations needed (standard English)"
         
-        summary = "Translated from Pidgin:\n"
-        for original, translated in translation_map.items():
-            summary += f"  • '{original}' → '{translated}'\n"
+        summary = "Translated from Pidgin:\n" + "".join(
+            f"  • '{original}' → '{translated}'\n"
+            for original, translated in translation_map.items()
+        )
         
         return summary.strip()
 
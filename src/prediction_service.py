@@ -4,18 +4,21 @@ Unified interface for all AI models - ready for backend integration
 """
 
 import os
-import json
-import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 import warnings
 warnings.filterwarnings('ignore')
 
-# Import our custom modules
-from volume_forecast_model import PatientVolumeForecaster
+# Import our custom modules. The forecaster (pandas, Prophet, matplotlib) is
+# imported when a forecaster is first built, so outbreak and resource checks
+# do not pay for it
 from outbreak_detector import OutbreakDetector
 from resource_optimizer import ResourceOptimizer
 
+# Shared by every service: runs forecasts alongside the other analyses
+_FORECAST_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="forecast")
+
 class PredictionService:
     """
     Unified prediction service that wraps all AI models
@@ -43,10 +46,16 @@ class PredictionService:
     def _initialize_forecaster(self):
         """Initialize the forecasting model"""
         try:
+            from volume_forecast_model import PatientVolumeForecaster
+            from forecaster_cache import load_or_train
             self.forecaster = PatientVolumeForecaster()
-            df = self.forecaster.load_data(self.data_path)
-            self.forecaster.train_model(df, test_split=0.2)
-            print("✅ Forecasting model loaded and trained")
+            
+            # Reuse the fitted model while the training data is unchanged
+            _, from_cache = load_or_train(self.forecaster, self.data_path, test_split=0.2)
+            if from_cache:
+                print("✅ Forecasting model loaded from cache")
+            else:
+                print("✅ Forecasting model loaded and trained")
         except Exception as e:
             print(f"⚠️ Warning: Could not initialize forecaster: {e}")
             self.forecaster = None
@@ -63,12 +72,17 @@ class PredictionService:
         Returns:
             JSON response with forecast data
         """
+        return self._patient_forecast(facility_id, days_ahead, datetime.now().isoformat())
+    
+    def _patient_forecast(self, facility_id: Optional[str], days_ahead: int,
+                          timestamp: str) -> Dict[str, Any]:
+        """get_patient_forecast, stamped with the caller's timestamp"""
         if not self.forecaster:
             return {
                 "error": "Forecasting model not available",
                 "message": "Patient visit data not found or model failed to initialize",
                 "facility_id": facility_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
         try:
@@ -76,16 +90,9 @@ class PredictionService:
             forecast_df = self.forecaster.generate_forecast(days_ahead)
             
             # Convert to JSON-serializable format
-            forecast_data = []
-            for _, row in forecast_df.iterrows():
-                forecast_data.append({
-                    "date": row['ds'].strftime('%Y-%m-%d'),
-                    "day_of_week": row['ds'].strftime('%A'),
-                    "predicted_patients": int(row['yhat']),
-                    "lower_bound": int(row['yhat_lower']),
-                    "upper_bound": int(row['yhat_upper']),
-                    "confidence_interval": f"{int(row['yhat_lower'])}-{int(row['yhat_upper'])}"
-                })
+            forecast_data = self.forecaster.forecast_records(forecast_df)
+            for day in forecast_data:
+                day["confidence_interval"] = f"{day['lower_bound']}-{day['upper_bound']}"
             
             # Generate summary
             summary = self.forecaster.get_forecast_summary(forecast_df)
@@ -104,7 +111,7 @@ class PredictionService:
                     "peak_day": summary['peak_day'],
                     "lowest_day": summary['lowest_day']
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -112,7 +119,7 @@ class PredictionService:
                 "success": False,
                 "error": str(e),
                 "facility_id": facility_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def check_outbreak_risk(self, disease: str, region: str, 
@@ -131,9 +138,11 @@ class PredictionService:
         Returns:
             JSON response with outbreak analysis
         """
+        timestamp = datetime.now().isoformat()
         try:
             analysis = self.outbreak_detector.detect_outbreak(
-                disease, current_cases, historical_cases, time_period
+                disease, current_cases, historical_cases, time_period,
+                timestamp=timestamp
             )
             
             # Add region information
@@ -142,7 +151,7 @@ class PredictionService:
             return {
                 "success": True,
                 "analysis": analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -151,7 +160,7 @@ class PredictionService:
                 "error": str(e),
                 "disease": disease,
                 "region": region,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def analyze_multiple_outbreaks(self, outbreak_data: Dict[str, Dict]) -> Dict[str, Any]:
@@ -168,20 +177,27 @@ class PredictionService:
         Returns:
             JSON response with multi-disease analysis
         """
+        return self._multiple_outbreaks(outbreak_data, datetime.now().isoformat())
+    
+    def _multiple_outbreaks(self, outbreak_data: Dict[str, Dict],
+                            timestamp: str) -> Dict[str, Any]:
+        """analyze_multiple_outbreaks, stamped with the caller's timestamp"""
         try:
-            analysis = self.outbreak_detector.analyze_multiple_diseases(outbreak_data)
+            analysis = self.outbreak_detector.analyze_multiple_diseases(
+                outbreak_data, timestamp=timestamp
+            )
             
             return {
                 "success": True,
                 "analysis": analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def recommend_resources(self, predicted_patients: int, 
@@ -198,6 +214,12 @@ class PredictionService:
         Returns:
             JSON response with staffing recommendations
         """
+        return self._resources(predicted_patients, current_staff, facility_type,
+                               datetime.now().isoformat())
+    
+    def _resources(self, predicted_patients: int, current_staff: Optional[Dict[str, int]],
+                   facility_type: str, timestamp: str) -> Dict[str, Any]:
+        """recommend_resources, stamped with the caller's timestamp"""
         try:
             analysis = self.resource_optimizer.recommend_staffing(
                 predicted_patients, current_staff, facility_type
@@ -206,7 +228,7 @@ class PredictionService:
             return {
                 "success": True,
                 "analysis": analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -214,7 +236,7 @@ class PredictionService:
                 "success": False,
                 "error": str(e),
                 "predicted_patients": predicted_patients,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def analyze_inventory(self, inventory_data: Dict[str, Dict]) -> Dict[str, Any]:
@@ -227,20 +249,24 @@ class PredictionService:
         Returns:
             JSON response with inventory analysis
         """
+        return self._inventory(inventory_data, datetime.now().isoformat())
+    
+    def _inventory(self, inventory_data: Dict[str, Dict], timestamp: str) -> Dict[str, Any]:
+        """analyze_inventory, stamped with the caller's timestamp"""
         try:
             analysis = self.resource_optimizer.analyze_inventory(inventory_data)
             
             return {
                 "success": True,
                 "analysis": analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def get_comprehensive_analysis(self, facility_id: str, 
@@ -259,28 +285,34 @@ class PredictionService:
         Returns:
             Comprehensive analysis combining all models
         """
+        # One clock reading for the combined response and every sub-analysis
+        timestamp = datetime.now().isoformat()
         try:
-            # Get patient forecast
-            forecast = self.get_patient_forecast(facility_id, days_ahead=7)
+            # Only the Prophet forecast is slow; it runs in the background
+            # while the outbreak and inventory analyses run here
+            forecast_future = _FORECAST_EXECUTOR.submit(
+                self._patient_forecast, facility_id, 7, timestamp
+            )
             
             # Get outbreak analysis if data provided
             outbreak_analysis = None
             if outbreak_data:
-                outbreak_analysis = self.analyze_multiple_outbreaks(outbreak_data)
+                outbreak_analysis = self._multiple_outbreaks(outbreak_data, timestamp)
             
-            # Get resource recommendations
+            # Get inventory analysis if data provided
+            inventory_analysis = None
+            if inventory_data:
+                inventory_analysis = self._inventory(inventory_data, timestamp)
+            
+            # Get resource recommendations (needs the forecast)
+            forecast = forecast_future.result()
             resource_analysis = None
             if forecast.get("success") and current_staff:
                 predicted_patients = forecast["summary"]["average_daily_patients"]
-                resource_analysis = self.recommend_resources(
-                    predicted_patients, current_staff
+                resource_analysis = self._resources(
+                    predicted_patients, current_staff, "standard", timestamp
                 )
             
-            # Get inventory analysis if data provided
-            inventory_analysis = None
-            if inventory_data:
-                inventory_analysis = self.analyze_inventory(inventory_data)
-            
             return {
                 "success": True,
                 "facility_id": facility_id,
@@ -288,7 +320,7 @@ class PredictionService:
                 "outbreak_analysis": outbreak_analysis,
                 "resource_analysis": resource_analysis,
                 "inventory_analysis": inventory_analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -296,7 +328,7 @@ class PredictionService:
                 "success": False,
                 "error": str(e),
                 "facility_id": facility_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def get_service_status(self) -> Dict[str, Any]:
@@ -3,17 +3,37 @@ MediLink PHC - Resource Optimization System
 Provides staffing and inventory recommendations based on patient forecasts
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-import json
 
 class ResourceOptimizer:
     """
     Optimizes PHC resources based on patient volume forecasts
     """
     
+    # Stockout recommendations per alert level (immutable; copied per response)
+    _STOCKOUT_RECOMMENDATIONS: Dict[str, Tuple[str, ...]] = {
+        "critical": (
+            "🚨 IMMEDIATE ACTION: Order now!",
+            "Contact emergency supply chain",
+            "Consider borrowing from nearby facilities"
+        ),
+        "warning": (
+            "⚠️ Order within 24 hours",
+            "Contact district pharmacy"
+        ),
+        "caution": (
+            "📋 Plan to order soon",
+            "Monitor usage patterns"
+        ),
+        "normal": (
+            "✅ Stock levels adequate",
+        )
+    }
+    _CRITICAL_DRUG_RECOMMENDATIONS: Tuple[str, ...] = ("Critical drug - prioritize restocking",)
+    _NO_USAGE_RECOMMENDATIONS: Tuple[str, ...] = ("No usage data - monitor closely",)
+    
     def __init__(self):
         # PHC capacity parameters
         self.nurse_capacity = 30  # Patients per nurse per day
@@ -195,7 +215,7 @@ class ResourceOptimizer:
                 "days_remaining": float('inf'),
                 "stockout_date": None,
                 "alert_level": "none",
-                "recommendations": ["No usage data - monitor closely"],
+                "recommendations": list(self._NO_USAGE_RECOMMENDATIONS),
                 "timestamp": datetime.now().isoformat()
             }
         
@@ -248,26 +268,15 @@ class ResourceOptimizer:
     def _generate_stockout_recommendations(self, drug_name: str, days_remaining: float,
                                          lead_time_days: int, alert_level: str) -> List[str]:
         """Generate stockout recommendations"""
-        recommendations = []
-        
-        if alert_level == "critical":
-            recommendations.append("🚨 IMMEDIATE ACTION: Order now!")
-            recommendations.append("Contact emergency supply chain")
-            recommendations.append("Consider borrowing from nearby facilities")
-        elif alert_level == "warning":
-            recommendations.append("⚠️ Order within 24 hours")
-            recommendations.append("Contact district pharmacy")
-        elif alert_level == "caution":
-            recommendations.append("📋 Plan to order soon")
-            recommendations.append("Monitor usage patterns")
-        else:
-            recommendations.append("✅ Stock levels adequate")
+        recommendations = self._STOCKOUT_RECOMMENDATIONS.get(
+            alert_level, self._STOCKOUT_RECOMMENDATIONS["normal"]
+        )
         
         # Add drug-specific recommendations
-        if drug_name in self.critical_drugs:
-            recommendations.append("Critical drug - prioritize restocking")
+        extra = self._CRITICAL_DRUG_RECOMMENDATIONS if drug_name in self.critical_drugs else ()
         
-        return recommendations
+        # A fresh list per response, so callers may modify it
+        return [*recommendations, *extra]
     
     def analyze_inventory(self, inventory_data: Dict[str, Dict]) -> Dict:
         """
@@ -12,24 +12,43 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow  # noqa: F401  (enables pandas' multithreaded CSV reader)
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 class PatientVolumeForecaster:
     """
     Patient volume forecasting using Facebook Prophet
     """
     
+    # Bump whenever train_model's Prophet settings change, so cached models
+    # fitted with the old settings are not reused
+    MODEL_VERSION = 1
+    
     def __init__(self):
         self.model = None
         self.trained = False
         
-    def load_data(self, csv_path='data/patient_visits.csv'):
+    def load_data(self, csv_path='data/patient_visits.csv', **read_csv_kwargs):
         """
         Load patient visit data and prepare for Prophet
+        
+        Only the date and patient_count columns are parsed, with explicit
+        dtypes; extra keyword arguments are passed through to pd.read_csv.
         """
         print("📊 Loading patient visit data...")
         
         # Load data
-        df = pd.read_csv(csv_path)
-        df['date'] = pd.to_datetime(df['date'])
+        options = {
+            'usecols': ['date', 'patient_count'],
+            'dtype': {'patient_count': 'int32'},
+            'parse_dates': ['date'],
+            'engine': CSV_ENGINE,
+        }
+        options.update(read_csv_kwargs)
+        df = pd.read_csv(csv_path, **options)
         
         # Prophet requires 'ds' and 'y' columns
         prophet_df = df.rename(columns={'date': 'ds', 'patient_count': 'y'})
@@ -171,6 +190,31 @@ class PatientVolumeForecaster:
         
         return future_forecast
     
+    def forecast_records(self, forecast_df):
+        """
+        Convert a forecast to JSON-ready dicts of plain Python values
+        
+        Each column is converted once (tolist), then the rows are zipped
+        together, instead of boxing cells row by row.
+        """
+        ds = forecast_df['ds']
+        return [
+            {
+                'date': date,
+                'day_of_week': day_of_week,
+                'predicted_patients': predicted,
+                'lower_bound': lower,
+                'upper_bound': upper
+            }
+            for date, day_of_week, predicted, lower, upper in zip(
+                ds.dt.strftime('%Y-%m-%d').tolist(),
+                ds.dt.day_name().tolist(),
+                forecast_df['yhat'].astype(int).tolist(),
+                forecast_df['yhat_lower'].astype(int).tolist(),
+                forecast_df['yhat_upper'].astype(int).tolist()
+            )
+        ]
+    
     def visualize_forecast(self, historical_df, forecast_df, save_path='reports/patient_forecast.png'):
         """
         Create visualization of historical data and forecast
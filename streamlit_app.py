@@ -31,6 +31,12 @@ st.title("🏥 MediLink PHC — Interactive Playground")
 st.caption("Test multilingual triage, forecasts, outbreak alerts, and staffing.")
 
 
+@st.cache_resource
+def get_prediction_service():
+    """One BackendPredictionService per process, reused across reruns"""
+    return BackendPredictionService()
+
+
 def _set_env_var(name: str, value: str | None):
     if value:
         os.environ[name] = value
@@ -217,7 +223,8 @@ def render_forecast_tab():
     days = st.slider("Days Ahead", 7, 30, 7)
     run = st.button("Generate Forecast")
     if run:
-        service = BackendPredictionService()
+        service = get_prediction_service()
+        service.wait_for_forecaster()
         res = service.get_patient_forecast(days_ahead=days)
         if not res.get("success"):
             st.error(res.get("error", {}).get("user_message", "Forecast unavailable."))
@@ -243,7 +250,7 @@ def render_outbreak_tab():
         except Exception:
             st.warning("Please enter valid historical counts.")
             return
-        service = BackendPredictionService()
+        service = get_prediction_service()
         res = service.check_outbreak(disease, "Test Region", current, hist)
         if not res.get("success"):
             st.error(res.get("error", {}).get("user_message", "Unable to analyze outbreak."))
@@ -269,7 +276,7 @@ def render_resources_tab():
     facility = st.selectbox("Facility Type", ["standard", "busy", "rural"], index=0)
     run = st.button("Recommend Resources")
     if run:
-        service = BackendPredictionService()
+        service = get_prediction_service()
         res = service.recommend_resources(patients, {"nurses": nurses, "doctors": doctors, "pharmacists": pharmacists}, facility)
         if not res.get("success"):
             st.error(res.get("error", {}).get("user_message", "Unable to recommend resources."))
@@ -177,6 +177,7 @@ class EndToEndTester:
         
         try:
             # Test other backend services
+            self.prediction_service.wait_for_forecaster()
             forecast_result = self.prediction_service.get_patient_forecast("TEST_PHC", days_ahead=7)
             outbreak_result = self.prediction_service.check_outbreak(
                 "Malaria", "Test Region", 25, [20, 22, 18, 25, 21]
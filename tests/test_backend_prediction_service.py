@@ -0,0 +1,146 @@
+"""
+MediLink PHC - Backend Prediction Service Tests
+Checks the batch and pre-encoded endpoints against their single-call forms
+"""
+
+import os
+import sys
+import json
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import backend_prediction_service
+from backend_prediction_service import BackendPredictionService
+from volume_forecast_model import PatientVolumeForecaster
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() is pinned, so two responses can be compared"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 6, 1, 8, 30)
+
+
+class StubTriageService:
+    """Stands in for AITriageServiceV3; fails for patients without symptoms"""
+
+    def analyze_patient(self, patient_data):
+        if not patient_data.get("symptoms"):
+            raise ValueError("No symptoms provided")
+        return {
+            "triage_level": 3 if patient_data["age"] > 60 else 4,
+            "triage_label": "Urgent" if patient_data["age"] > 60 else "Standard",
+            "conditions": [{"name": s, "likelihood": "medium"} for s in patient_data["symptoms"]],
+            "referral_needed": patient_data["age"] > 60,
+            "confidence_score": 0.8
+        }
+
+
+def _service(tmp_path):
+    # No data file, so no forecaster is trained in the background
+    service = BackendPredictionService(data_path=str(tmp_path / 'missing.csv'))
+    service._triage_service = StubTriageService()
+    return service
+
+
+def test_triage_bulk_matches_single_calls(tmp_path):
+    service = _service(tmp_path)
+    patients = [
+        {"age": 30, "gender": "F", "symptoms": ["fever", "headache"]},
+        {"age": 70, "gender": "M", "symptoms": ["chest pain"]},
+        {"age": 25, "gender": "M", "symptoms": []},
+        {"age": 8, "gender": "F", "symptoms": ["cough"]}
+    ]
+
+    bulk = service.analyze_triage_bulk(patients)
+    assert bulk["success"]
+    assert bulk["data"]["count"] == 4 and bulk["data"]["failed"] == 1
+
+    for patient, result in zip(patients, bulk["data"]["results"]):
+        single = service.analyze_triage(patient)
+        assert result["success"] == single["success"]
+        if single["success"]:
+            assert result["data"] == single["data"]
+        else:
+            assert result["error"]["message"] == single["error"]["message"]
+
+
+def test_triage_bulk_without_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend_prediction_service, 'AITriageServiceV3', None)
+    service = BackendPredictionService(data_path=str(tmp_path / 'missing.csv'))
+
+    bulk = service.analyze_triage_bulk([{"age": 30, "symptoms": ["fever"]}])
+    assert not bulk["success"]
+    assert bulk["error"]["code"] == "TRIAGE_ERROR"
+
+
+def _forecasting_service(tmp_path):
+    """Service with a ready forecaster and today's forecast already cached"""
+    service = _service(tmp_path)
+    service.forecaster = PatientVolumeForecaster()
+    service.forecaster.trained = True
+    days = backend_prediction_service.MAX_FORECAST_DAYS
+    service._cached_forecast = pd.DataFrame({
+        'ds': pd.date_range(date.today(), periods=days),
+        'yhat': [40.0 + (i % 7) * 3.5 for i in range(days)],
+        'yhat_lower': [30.0 + i % 7 for i in range(days)],
+        'yhat_upper': [55.5 + i % 7 for i in range(days)]
+    })
+    service._cached_forecast_date = date.today()
+    return service
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_forecast_json_matches_dict(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and not backend_prediction_service.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(backend_prediction_service, 'ORJSON_AVAILABLE', use_orjson)
+    monkeypatch.setattr(backend_prediction_service, 'datetime', FixedDatetime)
+    service = _forecasting_service(tmp_path)
+
+    for days_ahead in (7, 30, 0):
+        result = service.get_patient_forecast("PHC-001", days_ahead)
+        assert result["success"] == (days_ahead > 0)
+        body = service.get_patient_forecast_json("PHC-001", days_ahead)
+        assert isinstance(body, bytes)
+        assert json.loads(body) == json.loads(json.dumps(result))
+
+
+def test_forecast_warming_up_until_forecaster_ready(tmp_path, monkeypatch):
+    release = threading.Event()
+
+    def slow_initialize(service):
+        release.wait(5)
+        service._forecaster_ready.set()
+
+    monkeypatch.setattr(BackendPredictionService, '_initialize_forecaster', slow_initialize)
+    csv_path = tmp_path / 'patient_visits.csv'
+    csv_path.write_text("date,patient_count\n2025-01-01,40\n")
+    service = BackendPredictionService(data_path=str(csv_path))
+
+    assert not service.wait_for_forecaster(timeout=0.01)
+    result = service.get_patient_forecast(days_ahead=7)
+    assert not result["success"]
+    assert result["error"]["code"] == "FORECAST_WARMING_UP"
+    assert result["error"]["retry_after_seconds"] > 0
+    assert service.get_service_status()["data"]["forecasting_model_warming_up"]
+
+    # Other endpoints do not wait for the forecaster
+    assert service.check_outbreak("Malaria", "Lagos", 45, [20, 22, 18, 25, 21])["success"]
+
+    release.set()
+    assert service.wait_for_forecaster(timeout=5)
+    # Initialization left no forecaster behind, so it is now unavailable
+    result = service.get_patient_forecast(days_ahead=7)
+    assert result["error"]["code"] == "FORECAST_UNAVAILABLE"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,118 @@
+"""
+MediLink PHC - Forecaster Model Cache Tests
+Checks when the pickled forecaster is reused and when it is retrained
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import forecaster_cache
+
+
+class FakeForecaster:
+    """Stands in for PatientVolumeForecaster; records how often it trains"""
+
+    MODEL_VERSION = 1
+    fits = 0
+
+    def __init__(self):
+        self.model = None
+        self.trained = False
+
+    def load_data(self, csv_path):
+        df = pd.read_csv(csv_path, parse_dates=['date'])
+        return df.rename(columns={'date': 'ds', 'patient_count': 'y'})
+
+    def train_model(self, df, test_split=0.2):
+        FakeForecaster.fits += 1
+        self.model = {"rows": len(df), "test_split": test_split}
+        self.trained = True
+
+
+def _write_csv(path, days):
+    pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=days).strftime('%Y-%m-%d'),
+        'patient_count': range(days)
+    }).to_csv(path, index=False)
+
+
+def _setup(tmp_path, monkeypatch):
+    monkeypatch.setattr(forecaster_cache, 'MODEL_CACHE_PATH',
+                        str(tmp_path / 'models' / 'forecaster.pkl'))
+    FakeForecaster.fits = 0
+    csv_path = str(tmp_path / 'patient_visits.csv')
+    _write_csv(csv_path, 30)
+    return csv_path
+
+
+def test_unchanged_data_reuses_cached_model(tmp_path, monkeypatch):
+    csv_path = _setup(tmp_path, monkeypatch)
+
+    key, from_cache = forecaster_cache.load_or_train(FakeForecaster(), csv_path)
+    assert not from_cache
+
+    forecaster = FakeForecaster()
+    key_again, from_cache = forecaster_cache.load_or_train(forecaster, csv_path)
+    assert from_cache and key_again == key
+    assert forecaster.trained and forecaster.model == {"rows": 30, "test_split": 0.2}
+    assert FakeForecaster.fits == 1
+
+
+def test_changed_data_retrains(tmp_path, monkeypatch):
+    csv_path = _setup(tmp_path, monkeypatch)
+    key, _ = forecaster_cache.load_or_train(FakeForecaster(), csv_path)
+
+    _write_csv(csv_path, 31)
+    forecaster = FakeForecaster()
+    new_key, from_cache = forecaster_cache.load_or_train(forecaster, csv_path)
+    assert not from_cache and new_key != key
+    assert forecaster.model["rows"] == 31
+
+
+def test_changed_parameters_retrain(tmp_path, monkeypatch):
+    csv_path = _setup(tmp_path, monkeypatch)
+    key, _ = forecaster_cache.load_or_train(FakeForecaster(), csv_path, test_split=0.2)
+
+    # A different split is a different fit
+    forecaster = FakeForecaster()
+    split_key, from_cache = forecaster_cache.load_or_train(forecaster, csv_path, test_split=0.5)
+    assert not from_cache and split_key != key
+    assert forecaster.model["test_split"] == 0.5
+
+    # So are new model settings and a different Prophet release
+    monkeypatch.setattr(FakeForecaster, 'MODEL_VERSION', 2)
+    _, from_cache = forecaster_cache.load_or_train(FakeForecaster(), csv_path, test_split=0.5)
+    assert not from_cache
+
+    monkeypatch.setattr(forecaster_cache, 'PROPHET_VERSION', 'other')
+    _, from_cache = forecaster_cache.load_or_train(FakeForecaster(), csv_path, test_split=0.5)
+    assert not from_cache
+    assert FakeForecaster.fits == 4
+
+
+def test_stale_parquet_is_ignored(tmp_path, monkeypatch):
+    csv_path = _setup(tmp_path, monkeypatch)
+    parquet_path = str(tmp_path / 'patient_visits.parquet')
+    FakeForecaster().load_data(csv_path).to_parquet(parquet_path)
+    assert forecaster_cache.training_source(csv_path) == parquet_path
+
+    # CSV rewritten after the Parquet copy was made
+    time.sleep(0.01)
+    _write_csv(csv_path, 31)
+    os.utime(parquet_path, (0, 0))
+    assert forecaster_cache.training_source(csv_path) == csv_path
+
+    forecaster = FakeForecaster()
+    forecaster_cache.load_or_train(forecaster, csv_path)
+    assert forecaster.model["rows"] == 31
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
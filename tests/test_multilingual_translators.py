@@ -0,0 +1,52 @@
+"""
+MediLink PHC - Multilingual Translator Tests
+Checks the single-pass and batch APIs against their per-language forms
+"""
+
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from multilingual_translator import MultilingualTranslator
+from multilingual_translator_improved import EnhancedMultilingualTranslator
+
+
+def test_translate_any_matches_per_language():
+    translator = MultilingualTranslator()
+
+    # Every table phrase translates as it would with its own language
+    for language, mappings in translator.languages.items():
+        for phrase in mappings:
+            assert translator.translate_any(phrase) == \
+                translator._translate_with_language(phrase, language)
+
+
+def test_translate_any_mixed_languages():
+    translator = MultilingualTranslator()
+
+    translated, changes = translator.translate_any("body dey hot, ciwon kai")
+    assert translated == "fever, headache"
+    assert changes == ["'body dey hot' → 'fever'", "'ciwon kai' → 'headache'"]
+
+    assert translator.translate_any("no symptoms here") == ("no symptoms here", [])
+
+
+def test_detect_languages_matches_detect_language():
+    translator = EnhancedMultilingualTranslator()
+
+    phrases = [phrase for mappings in translator.languages.values() for phrase in mappings]
+    # Mixed-language texts, blanks and case variants, batched together so a
+    # hit near a text boundary would be attributed to the wrong text
+    mixed = [f"{a} {b}" for a, b in zip(phrases[::7], reversed(phrases))]
+    texts = phrases + mixed + ["", "   ", "headache", "Body Dey HOT", "zazzabi da ciwon kai"]
+
+    assert translator.detect_languages(texts) == [translator.detect_language(t) for t in texts]
+    assert translator.detect_languages(["body dey hot"]) == ["pidgin"]
+    assert translator.detect_languages([]) == []
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))